@@ -80,8 +80,17 @@ HELPER_EOF
 
 sudo chmod 755 "$HELPER_SCRIPT"
 
-echo "Writing udev rule as root..."
-sudo install -m 644 "$TMPFILE" "$RULE_FILE"
+RULES_CHANGED=1
+if [ -f "$RULE_FILE" ] && cmp -s "$TMPFILE" "$RULE_FILE"; then
+  RULES_CHANGED=0
+  echo "udev rule at $RULE_FILE is already up to date."
+else
+  echo "Writing udev rule as root..."
+  # Install next to the target and rename into place so udev never sees a
+  # partially written rules file.
+  sudo install -m 644 "$TMPFILE" "$RULE_FILE.tmp"
+  sudo mv -f "$RULE_FILE.tmp" "$RULE_FILE"
+fi
 rm -f "$TMPFILE"
 
 echo "Ensuring group 'liquidctl' exists..."
@@ -90,9 +99,13 @@ sudo groupadd -f liquidctl
 echo "Adding current user ($USER) to 'liquidctl' group..."
 sudo usermod -aG liquidctl "$USER"
 
-echo "Reloading udev rules and triggering..."
-sudo udevadm control --reload
-sudo udevadm trigger --subsystem-match=hwmon
+if [ "$RULES_CHANGED" -eq 1 ]; then
+  echo "Reloading udev rules and triggering..."
+  sudo udevadm control --reload
+  sudo udevadm trigger --subsystem-match=hwmon
+else
+  echo "Skipping udev reload (rules unchanged)."
+fi
 
 echo "Fixing permissions on existing hwmon devices..."
 for hwmon_dev in /sys/class/hwmon/hwmon*; do
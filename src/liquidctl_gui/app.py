@@ -6,26 +6,24 @@ Recommended: run ./launch.sh to create a virtualenv and install `liquidctl`.
 Ensure system GTK bindings (python3-gi, gir1.2-gtk-3.0) are provided by your distro.
 """
 
-import json
+import concurrent.futures
+import functools
+import itertools
 import logging
+import operator
 import os
 import re
-import shutil
-import subprocess
-from pathlib import Path
+import time
 
 from . import __version__
-from .lib.config import (
-    load_config, save_config, save_profile as save_profile_to_disk,
-    load_profile as load_profile_from_disk, list_profiles,
-    delete_profile, save_current_state, load_current_state
-)
+from .lib.config import load_config, save_config, load_current_state
 from .lib.config_helpers import ConfigHelpers
-from .lib.functions import DeviceInfo, LiquidctlCore
+from .lib.error_handler import is_device_not_found
+from .lib.functions import LiquidctlCore
 from .lib.ui_helpers import UiHelpers
 from .lib.hwmon_api import HwmonDevice
 from .lib import sensors_api
-from .lib.backends import discover_devices, get_all_backends
+from .lib.backends import BackendRegistry, discover_devices, get_all_backends
 from .lib.device_controller import DeviceController
 from .lib.profile_manager import ProfileManager
 from .lib.startup import disable_startup, enable_startup, get_startup_enabled
@@ -38,6 +36,14 @@ WINDOW_HEIGHT = 1010
 STATUS_TEXT_HEIGHT = 220
 PANED_POSITION = 569  # Default split position between controls and status panel
 AUTO_REFRESH_SECONDS = 3  # Status monitoring interval (temps/speeds)
+HIDDEN_REFRESH_SECONDS = AUTO_REFRESH_SECONDS * 6  # Timer back-off while minimized/unmapped
+DEVICE_STATUS_TIMEOUT_SECONDS = 2  # Longest a poll waits on one device before showing its last reading
+MIN_REFRESH_DELAY_MS = 500  # Floor between polls when a slow poll overran the next due section
+WINDOW_STATE_SAVE_DELAY_MS = 1000  # Coalescing window for resize/paned-drag saves
+STATE_SAVE_DELAY_MS = 500  # Coalescing window for slider/color-picker state saves
+PRESET_WRITE_DELAY_MS = 150  # Rapid preset clicks on one channel send only the last choice
+LOG_LEVELS = ["ERROR", "WARNING", "INFO", "DEBUG"]  # Choices offered in Settings
+LOG_BANNER = "=" * 50  # Separator around the startup log line
 DEFAULT_SPEED = 60
 PROFILE_DEFAULT_NAME = "profile.json"
 
@@ -54,6 +60,7 @@ DEFAULT_CONFIG = {
     "default_speed": DEFAULT_SPEED,
     "speed_presets": [40, 60, 80, 100],
     "log_level": "INFO",
+    "profile_pretty": True,  # Indent saved profile files; False writes compact JSON
     "preset_colors": [
         {"label": "White", "value": "#f0f8ff"},
         {"label": "Ice Blue", "value": "#4682b4"},
@@ -65,6 +72,31 @@ DEFAULT_CONFIG = {
 }
 
 
+# Status readings with two or more decimals are shown rounded to one
+_FLOAT_RE = re.compile(r'(\d+\.\d{2,})')
+
+
+def _format_float(match):
+    return f"{float(match.group(1)):.1f}"
+
+
+def _round_decimals(text):
+    """Round status readings to one decimal place."""
+    # Integer-only output (rpm, duty) has nothing to round
+    if "." not in text:
+        return text
+    return _FLOAT_RE.sub(_format_float, text)
+
+
+def _set_buffer_text(buffer, text):
+    """Replace buffer text, emitting property notifications once afterwards."""
+    buffer.freeze_notify()
+    try:
+        buffer.set_text(text)
+    finally:
+        buffer.thaw_notify()
+
+
 def _resolve_log_level(config):
     env_level = os.environ.get("LIQUIDCTL_GUI_LOG_LEVEL", "").strip()
     configured_level = str(config.get("log_level", "INFO")).strip()
@@ -83,33 +115,51 @@ except Exception:
 
 
 class DevicePlugin:
+    _logger = logging.getLogger(__name__)
+
+    # Seconds between status polls for this device (None disables polling)
+    REFRESH_INTERVAL = AUTO_REFRESH_SECONDS
+
     def __init__(self, app, device_info):
         self.app = app
         self.device = device_info
-        self.status_buffer = getattr(app, "status_buffer", None)
+        # channel -> speed scale built by build_ui, for refresh_values()
+        self._speed_scales = {}
 
     def build_ui(self, container):
         raise NotImplementedError
 
-    def refresh_status(self):
-        # Safety check: don't access buffer if it's None or window is destroyed
-        if not self.status_buffer:
-            return
-        try:
-            status, _ = self.app.core.get_status(self.device.match)
-            if status:
-                # Format numbers to 1 decimal place
-                status = re.sub(r'(\d+\.\d{2,})', lambda m: f"{float(m.group(1)):.1f}", status)
-            self.status_buffer.set_text(status or "No status available")
-        except Exception:
-            # Silently ignore errors (window may be closing)
-            pass
+    def rebind(self, device_info):
+        """Point this plugin at a re-detected instance of the same device."""
+        self.device = device_info
+        # Scales belonged to the previous detail page
+        self._speed_scales = {}
+
+    def refresh_values(self):
+        """Update built widgets from saved state in place; return False if a rebuild is needed."""
+        if not self._speed_scales:
+            return False
+        for channel, scale in self._speed_scales.items():
+            scale.set_value(self.app.get_saved_speed(self.device.match, channel))
+        return True
+
+    @property
+    def refresh_interval(self):
+        return self.REFRESH_INTERVAL
 
     def initialize(self):
-        result, err = self.app.core.initialize(self.device.match)
+        self.report_initialize(self.run_initialize())
+
+    def run_initialize(self):
+        """Initialize the device and return (result, error); safe to run off the GTK main thread."""
+        return self.app.core.initialize(self.device.match)
+
+    def report_initialize(self, outcome):
+        """Show the outcome of run_initialize() in the UI."""
+        result, err = outcome
         if err:
             # Gracefully skip unavailable devices during auto-init
-            if "not found" in err.lower():
+            if is_device_not_found(err):
                 self.app._logger.debug("Skipping initialization of unavailable device: %s", self.device.name)
                 self.app.status_label.set_text(f"Device {self.device.name} not available")
             else:
@@ -126,14 +176,15 @@ class DynamicDevicePlugin(DevicePlugin):
 
         # Build color controls for each channel
         if device.supports_lighting and device.color_channels:
+            preset_colors = self.app.get_preset_colors()
             for channel in device.color_channels:
                 self.app.add_section_label(container, f"{channel.title()} LED:")
-                self.app.add_button(container, "Pick Color", lambda ch=channel: self.app.pick_color(device.match, ch))
+                self.app.add_button(container, "Pick Color", functools.partial(self.app.pick_color, device.match, channel))
 
                 # Preset colors
                 preset_row = self.app.add_row(container)
-                for label, color_hex in self.app.get_preset_colors():
-                    self.app.add_button(preset_row, label, lambda c=color_hex, ch=channel: self.app.apply_preset_color(device.match, ch, c))
+                for label, color_hex in preset_colors:
+                    self.app.add_button(preset_row, label, functools.partial(self.app.apply_preset_color, device.match, channel, color_hex))
 
                 # Mode dropdown (use device's discovered modes)
                 if device.color_modes:
@@ -141,46 +192,36 @@ class DynamicDevicePlugin(DevicePlugin):
                     self.app.add_label(mode_row, f"Mode ({channel}):")
                     default_mode = device.color_modes[0] if device.color_modes else ""
                     mode_combo = self.app.add_combo(mode_row, device.color_modes, default_mode)
-                    self.app.add_button(mode_row, "Apply Mode", lambda ch=channel, combo=mode_combo: self.app.apply_mode_dynamic(device.match, ch, combo))
+                    self.app.add_button(mode_row, "Apply Mode", functools.partial(self.app.apply_mode_dynamic, device.match, channel, mode_combo))
 
         # Build speed controls for each speed channel
         if device.supports_cooling and device.speed_channels:
             speed_frame = self.app.add_frame(container, "Speed Control (%)")
             scale = self.app.add_scale(speed_frame, 0, 100, self.app.get_saved_speed(device.match, device.speed_channels[0]))
+            # One slider serves every channel; it shows the first channel's speed
+            self._speed_scales = {device.speed_channels[0]: scale}
 
+            speed_presets = self.app.get_speed_presets()
             for channel in device.speed_channels:
                 row = self.app.add_row(speed_frame)
                 self.app.add_label(row, f"{channel.title()} presets:")
-                for preset in self.app.get_speed_presets():
-                    self.app.add_button(row, f"{preset}%", lambda p=preset, ch=channel: self.app.apply_speed_preset(device.match, ch, p, scale))
+                for preset in speed_presets:
+                    self.app.add_button(row, f"{preset}%", functools.partial(self.app.apply_speed_preset, device.match, channel, preset, scale))
 
             action_row = self.app.add_row(speed_frame)
             for channel in device.speed_channels:
-                self.app.add_button(action_row, f"Apply {channel.title()} Speed", lambda ch=channel: self.app.apply_speed(device.match, ch, int(scale.get_value())))
+                self.app.add_button(action_row, f"Apply {channel.title()} Speed", functools.partial(self._apply_scale_speed, channel, scale))
 
         self.app.add_separator(container)
 
-    def refresh_status(self):
-        # Safety check: don't access buffer if it's None or window is destroyed
-        if not self.status_buffer:
-            return
-        try:
-            status, _ = self.app.core.get_status(self.device.match)
-            if status:
-                # Format numbers to 1 decimal place
-                status = re.sub(r'(\d+\.\d{2,})', lambda m: f"{float(m.group(1)):.1f}", status)
-                self.status_buffer.set_text(status)
-            elif self.device.supports_lighting and not self.device.supports_cooling:
-                self.status_buffer.set_text("Lighting only (no status reported by device)")
-            else:
-                self.status_buffer.set_text("No status available")
-        except Exception:
-            # Silently ignore errors (window may be closing)
-            pass
+    def _apply_scale_speed(self, channel, scale, _button=None):
+        self.app.apply_speed(self.device.match, channel, int(scale.get_value()))
 
 
 class HwmonDevicePlugin(DevicePlugin):
     """Plugin for motherboard PWM fan control via hwmon."""
+
+    REFRESH_INTERVAL = 2
     
     def build_ui(self, container):
         device = self.device
@@ -200,6 +241,7 @@ class HwmonDevicePlugin(DevicePlugin):
         
         # Get PWM channels from the hwmon device
         channels = get_speed_channels(device)
+        self._speed_scales = {}
         channel_labels = get_speed_channel_labels(device)
         
         if not channels:
@@ -207,6 +249,8 @@ class HwmonDevicePlugin(DevicePlugin):
             self.app.add_separator(container)
             return
         
+        speed_presets = self.app.get_speed_presets()
+
         # Create a speed frame for each PWM channel
         for channel in channels:
             label = channel_labels.get(channel, channel)
@@ -215,15 +259,16 @@ class HwmonDevicePlugin(DevicePlugin):
             # Get saved speed or default to 60%
             saved_speed = self.app.get_saved_speed(device.match, channel)
             scale = self.app.add_scale(speed_frame, 0, 100, saved_speed)
+            self._speed_scales[channel] = scale
             
             # Preset buttons
             preset_row = self.app.add_row(speed_frame)
             self.app.add_label(preset_row, "Presets:")
-            for preset in self.app.get_speed_presets():
+            for preset in speed_presets:
                 self.app.add_button(
                     preset_row,
                     f"{preset}%",
-                    lambda p=preset, ch=channel, s=scale: self.app.apply_speed_preset(device.match, ch, p, s)
+                    functools.partial(self.app.apply_speed_preset, device.match, channel, preset, scale)
                 )
             
             # Apply button
@@ -231,59 +276,73 @@ class HwmonDevicePlugin(DevicePlugin):
             self.app.add_button(
                 action_row,
                 f"Apply {label}",
-                lambda ch=channel, s=scale: self.app.apply_hwmon_speed(device.match, ch, int(s.get_value()))
+                functools.partial(self._apply_scale_speed, channel, scale)
             )
         
         self.app.add_separator(container)
+
+    def _apply_scale_speed(self, channel, scale, _button=None):
+        self.app.apply_hwmon_speed(self.device.match, channel, int(scale.get_value()))
     
-    def refresh_status(self):
-        """Refresh fan speeds and temperatures from hwmon."""
-        if not self.status_buffer:
-            return
-        try:
-            # Get status directly from hwmon device
-            status_lines = []
-            status_data = self.device.get_status()
-            
-            for metric, value, unit in status_data:
-                status_lines.append(f"{metric:20s} {value:>6s} {unit}")
-            
-            if status_lines:
-                self.status_buffer.set_text("\n".join(status_lines))
-            else:
-                self.status_buffer.set_text("No status available")
-        except Exception as e:
-            # Log but don't crash
-            logger = logging.getLogger(__name__)
-            logger.debug("Error refreshing hwmon status: %s", e)
-    
-    def initialize(self):
+    def run_initialize(self):
         """Initialize hwmon device by enabling manual PWM control."""
         try:
-            results = self.device.initialize()
-            if results:
-                status_lines = [f"{msg}: {val} {unit}" for msg, val, unit in results]
-                self.app.status_label.set_text("; ".join(status_lines))
-            else:
-                self.app.status_label.set_text(f"Initialized {self.device.name}")
+            return self.device.initialize(), ""
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.exception("Failed to initialize hwmon device")
-            self.app.show_error(f"Failed to initialize {self.device.name}: {str(e)}")
+            self._logger.exception("Failed to initialize hwmon device")
+            return [], f"Failed to initialize {self.device.name}: {str(e)}"
+
+    def report_initialize(self, outcome):
+        results, err = outcome
+        if err:
+            self.app.show_error(err)
+        elif results:
+            status_lines = [f"{msg}: {val} {unit}" for msg, val, unit in results]
+            self.app.status_label.set_text("; ".join(status_lines))
+        else:
+            self.app.status_label.set_text(f"Initialized {self.device.name}")
 
 
 class GenericStatusPlugin(DevicePlugin):
     """Fallback plugin for devices without discoverable capabilities."""
+    REFRESH_INTERVAL = None
+
     def build_ui(self, container):
         self.app.add_section_label(container, self.device.name)
         self.app.add_section_label(container, "No controls available for this device type.")
         self.app.add_separator(container)
 
 
+# Config keys saved per hwmon device (each named after its HwmonDevice attribute)
+_HWMON_CONFIG_KEYS = ("name", "match", "chip_name")
+_HWMON_CONFIG_GETTER = operator.attrgetter(*_HWMON_CONFIG_KEYS)
+# (config key, DeviceInfo attribute) pairs saved for each liquidctl device
+_DEVICE_CONFIG_FIELDS = (
+    ("name", "name"),
+    ("match", "match"),
+    ("type", "device_type"),
+    ("color_channels", "color_channels"),
+    ("speed_channels", "speed_channels"),
+    ("color_modes", "color_modes"),
+    ("supports_lighting", "supports_lighting"),
+    ("supports_cooling", "supports_cooling"),
+)
+_DEVICE_CONFIG_KEYS = tuple(key for key, _attr in _DEVICE_CONFIG_FIELDS)
+_DEVICE_CONFIG_GETTER = operator.attrgetter(*(attr for _key, attr in _DEVICE_CONFIG_FIELDS))
+
+# Device classes with a dedicated plugin; anything else is dispatched on its
+# discovered capabilities (DynamicDevicePlugin or GenericStatusPlugin).
+_PLUGIN_TABLE = [
+    (HwmonDevice, HwmonDevicePlugin),
+]
+
+
 if GTK_AVAILABLE:
     class LiquidctlWindow(UiHelpers, ConfigHelpers, Gtk.ApplicationWindow):
         def __init__(self, app):
             self.config, self.config_exists, self.config_error = load_config(DEFAULT_CONFIG)
+            # Fallback slider value for channels with no saved speed
+            self._default_speed = self.get_config_int("default_speed", DEFAULT_SPEED)
 
             super().__init__(application=app, title=APP_TITLE)
             window_cfg = self.config.get("window", {})
@@ -295,6 +354,15 @@ if GTK_AVAILABLE:
             self._last_saved_paned = window_cfg.get("paned_position", PANED_POSITION)
             self._pending_window_state = None
             self._window_state_save_id = None
+            self._state_save_id = None
+            # (kind, device_match, channel) -> latest preset write awaiting its timeout
+            self._pending_preset_writes = {}
+            # About/Settings dialogs, built on first open and reused
+            self._about_dialog = None
+            self._settings_dialog = None
+            # Window settings as last written to disk, to skip no-op saves
+            self._last_persisted_window_cfg = dict(window_cfg)
+            self._last_configure_size = None
             self._window_initialized = False
 
             logging.basicConfig(
@@ -303,11 +371,25 @@ if GTK_AVAILABLE:
                 datefmt="%H:%M:%S"
             )
             self._logger = logging.getLogger(__name__)
-            self._logger.info("=" * 50)
+            self._logger.info(LOG_BANNER)
             self._logger.info("Liquidctl GUI starting...")
-            self._logger.info("=" * 50)
+            self._logger.info(LOG_BANNER)
 
             self.core = LiquidctlCore()
+            # Worker pool for blocking device/sensor reads during status polling
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="liquidctl-gui"
+            )
+            # Separate pool for per-device reads fanned out by _collect_status
+            # (which itself runs on self._executor, so sharing could deadlock)
+            self._device_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="liquidctl-gui-device"
+            )
+            # Startup initialization gets its own pool so slow inits never
+            # starve the status reads queued on _device_executor
+            self._init_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="liquidctl-gui-init"
+            )
             if self.core.using_api:
                 self._logger.info("Backend: Using liquidctl Python API (direct library access)")
             elif self.core.liquidctl_path:
@@ -315,9 +397,29 @@ if GTK_AVAILABLE:
             else:
                 self._logger.warning("Backend: liquidctl not found!")
             self.devices = []
+            # Subset of self.devices shown in the status panel; rebuilt on detect
+            self._cooling_devices = []
             self.plugins = {}
+            # Device class -> dedicated plugin class from _PLUGIN_TABLE (or None)
+            self._plugin_cls_cache = {}
             self.selected_device = None
+            # Device whose controls are currently shown in detail_box
+            self._detail_built_for = None
             self.refresh_id = None
+            # False while minimized/withdrawn; status polling skips device I/O
+            self._is_visible = True
+            # True while _collect_status runs, so overlapping triggers don't stack
+            self._status_refresh_in_flight = False
+            # Auto-initialize jobs still running on the worker pool
+            self._init_pending = 0
+            self._init_total = 0
+            # Per-section status text and next poll time (see _status_section)
+            self._status_sections = {}
+            self._status_due = {}
+            self._device_reads = {}  # device key -> latest read future
+            self._last_status_text = None
+            # Buffer/layout shape at the last status panel resize
+            self._status_layout_key = None
 
             self.last_colors = {}
             self.last_modes = {}
@@ -331,14 +433,17 @@ if GTK_AVAILABLE:
             self.device_controller = DeviceController(self)
             self.profile_manager = ProfileManager(self)
 
+            # Read the saved session state on a worker while the UI is built
+            # and devices are discovered; it is applied once both are done
+            current_state_future = self._executor.submit(load_current_state)
+
             self._build_ui()
             # Connect cleanup handler
             self.connect("destroy", self._on_window_destroy)
             self.connect("configure-event", self._on_window_configure)
-            # Start refresh cycle only after window is realized
-            self.connect("realize", self._on_window_realize)
-            # Mark window as initialized after it's shown
+            # Mark window as initialized and start the refresh cycle once it's shown
             self.connect("map-event", self._on_window_mapped)
+            self.connect("window-state-event", self._on_window_state_event)
             self.check_dependencies()
             if self.config_error:
                 self.show_error(f"Failed to load config. Using defaults. Details: {self.config_error}")
@@ -349,7 +454,7 @@ if GTK_AVAILABLE:
                 self.detect_devices()
 
             # Auto-load profile: restore previous session state
-            current_state, profile_name = load_current_state()
+            current_state, profile_name = current_state_future.result()
             if current_state:
                 self.profile_manager.apply_profile_data(current_state)
                 # Restore the active profile name
@@ -364,13 +469,7 @@ if GTK_AVAILABLE:
 
             # Refresh UI to show loaded profile settings
             self._refresh_ui()
-            # Note: refresh_status() is called in _on_window_realize() after window is shown
-
-        def _on_window_realize(self, widget):
-            """Called when window is realized and ready for display updates."""
-            self._logger.debug("Window realized, starting auto-refresh cycle")
-            # Now it's safe to start the refresh timer
-            self.refresh_status()
+            # Note: refresh_status() is called in _on_window_mapped() after window is shown
 
         def _build_ui(self):
             root_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
@@ -461,9 +560,16 @@ if GTK_AVAILABLE:
             device_scroll.set_vexpand(True)
             device_frame.add(device_scroll)
 
-            self.device_list = Gtk.ListBox()
-            self.device_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-            self.device_list.connect("row-selected", self.on_device_selected)
+            # One model row per device: (display name, device object)
+            self.device_store = Gtk.ListStore(str, object)
+            self.device_list = Gtk.TreeView(model=self.device_store)
+            self.device_list.set_headers_visible(False)
+            self.device_list.append_column(
+                Gtk.TreeViewColumn("Device", Gtk.CellRendererText(), text=0)
+            )
+            self.device_selection = self.device_list.get_selection()
+            self.device_selection.set_mode(Gtk.SelectionMode.SINGLE)
+            self.device_selection.connect("changed", self.on_device_selected)
             self.device_list.connect("button-press-event", self.on_device_list_button_press)
             device_scroll.add(self.device_list)
 
@@ -512,20 +618,35 @@ if GTK_AVAILABLE:
                 return False
 
             buffer = self.status_text_view.get_buffer()
-            start, end = buffer.get_bounds()
             min_height = self.get_config_int("status_text_height", STATUS_TEXT_HEIGHT)
+            allocation = self.detail_paned.get_allocation()
+
+            # Polls usually change a few digits, not the shape of the text.
+            # Skip the layout query when the line count and the widths and
+            # heights that affect wrapping are the same as last time.
+            layout_key = (
+                buffer.get_line_count(),
+                buffer.get_char_count() == 0,
+                self.status_text_view.get_allocated_width(),
+                allocation.height,
+                min_height,
+            )
+            if layout_key == self._status_layout_key:
+                return False
 
+            start, end = buffer.get_bounds()
             if start.equal(end):
                 self.status_scroller.set_min_content_height(min_height)
+                self._status_layout_key = layout_key
                 return False
 
             rect = self.status_text_view.get_iter_location(end)
             total_height = rect.y + rect.height
             target_height = max(min_height, total_height + 24)
 
-            allocation = self.detail_paned.get_allocation()
             if allocation.height <= 0:
                 return False
+            self._status_layout_key = layout_key
 
             max_height = max(100, allocation.height - 100)
             target_height = min(target_height, max_height)
@@ -541,7 +662,10 @@ if GTK_AVAILABLE:
                 window_cfg["height"] = int(height)
             if paned_position is not None:
                 window_cfg["paned_position"] = int(paned_position)
+            if window_cfg == self._last_persisted_window_cfg:
+                return
             save_config(self.config)
+            self._last_persisted_window_cfg = dict(window_cfg)
 
         def _schedule_window_state_save(self, width=None, height=None, paned_position=None):
             if self._pending_window_state is None:
@@ -553,10 +677,12 @@ if GTK_AVAILABLE:
             if paned_position is not None:
                 self._pending_window_state["paned_position"] = int(paned_position)
 
-            if self._window_state_save_id is not None:
-                GLib.source_remove(self._window_state_save_id)
-
-            self._window_state_save_id = GLib.timeout_add(200, self._flush_window_state_save)
+            # Drags emit many events per second; arm one flush and let later
+            # events just update the pending state it will write.
+            if self._window_state_save_id is None:
+                self._window_state_save_id = GLib.timeout_add(
+                    WINDOW_STATE_SAVE_DELAY_MS, self._flush_window_state_save
+                )
 
         def _flush_window_state_save(self):
             if not self._pending_window_state:
@@ -571,6 +697,13 @@ if GTK_AVAILABLE:
             # Ignore configure events until window is fully initialized
             if not self._window_initialized:
                 return False
+
+            # Moves and compositor animations emit configure events with an
+            # unchanged size; drop those before querying GTK.
+            event_size = (event.width, event.height)
+            if event_size == self._last_configure_size:
+                return False
+            self._last_configure_size = event_size
             
             # Use get_size() instead of event dimensions for accuracy
             width, height = self.get_size()
@@ -596,15 +729,18 @@ if GTK_AVAILABLE:
         def _on_window_mapped(self, widget, event):
             # Window is now fully shown and positioned, safe to track changes
             self._window_initialized = True
+            # GTK realizes a toplevel before mapping it, so the first poll (and a
+            # return to the fast cadence after an unmap) has to start here
+            self._logger.debug("Window mapped, starting auto-refresh cycle")
+            self.refresh_status()
             return False
 
         def load_devices_from_config(self):
             """Load devices from config and populate with fresh capabilities from discovery."""
+            self._release_devices()
             self.devices = []
-            self.plugins.clear()
-
-            for child in self.device_list.get_children():
-                self.device_list.remove(child)
+            self._cooling_devices = []
+            previous_plugins, self.plugins = self.plugins, {}
 
             devices_cfg = self.config.get("devices", [])
             if not devices_cfg:
@@ -616,17 +752,29 @@ if GTK_AVAILABLE:
             self._logger.info("Loading %d device(s) from config and refreshing capabilities", len(devices_cfg))
             
             # Use backend system for discovery (automatic deduplication)
-            backend_results = discover_devices()
-            discovered_map = {}
-            
-            # Build map of all discovered devices by their match identifier
-            for backend_class, devices in backend_results:
-                for device in devices:
-                    match_key = getattr(device, 'match', getattr(device, 'name', None))
-                    if match_key:
-                        discovered_map[match_key] = device
+            discovered_map, chip_index = self._index_discovered(discover_devices())
+
+            # Refill the sidebar with the view detached so it redraws once
+            self.device_list.set_model(None)
+            self.device_store.clear()
+            try:
+                self._load_config_entries(devices_cfg, discovered_map, chip_index, previous_plugins)
+            finally:
+                self.device_list.set_model(self.device_store)
+            self._cooling_devices = self._filter_cooling_devices()
 
-            # Match config entries with discovered devices and merge capabilities
+            if self.devices:
+                self.device_selection.select_path(Gtk.TreePath.new_first())
+                # Save discovered capabilities to config
+                self.update_config_devices()
+                # Auto-initialize if enabled
+                if self.config.get("auto_initialize_on_startup", True):
+                    self._logger.info("Auto-initialize scheduled")
+                    # Delay initialization significantly to ensure window is fully stable (2 seconds)
+                    GLib.timeout_add_seconds(2, self._auto_initialize_devices)
+
+        def _load_config_entries(self, devices_cfg, discovered_map, chip_index, previous_plugins):
+            """Match config entries with discovered devices and add their rows."""
             for entry in devices_cfg:
                 name = entry.get("name")
                 if not name:
@@ -640,13 +788,9 @@ if GTK_AVAILABLE:
                 # For hwmon devices, also try matching by chip_name if exact match fails
                 if not device and device_type == "hwmon":
                     chip_name = entry.get("chip_name")
-                    if chip_name:
-                        # Try to find by chip name
-                        for dev_match, dev in discovered_map.items():
-                            if isinstance(dev, HwmonDevice) and dev.chip_name == chip_name:
-                                device = dev
-                                self._logger.debug("Matched hwmon device %s by chip_name=%s", name, chip_name)
-                                break
+                    device = chip_index.get(chip_name) if chip_name else None
+                    if device:
+                        self._logger.debug("Matched hwmon device %s by chip_name=%s", name, chip_name)
                 
                 if device:
                     self._logger.debug("Loaded device %s from backend", name)
@@ -658,52 +802,42 @@ if GTK_AVAILABLE:
                     self._logger.info("Device %s not discovered, skipping", name)
                     continue
                 
+                # Two config entries can resolve to the same device (e.g. the chip_name fallback)
+                if self._device_key(device) in self.plugins:
+                    continue
                 self.devices.append(device)
-                row = Gtk.ListBoxRow()
-                row.device = device
-                # Use description for hwmon devices, name for others
-                display_name = device.description if isinstance(device, HwmonDevice) else device.name
-                row.add(Gtk.Label(label=display_name, xalign=0))
-                self.device_list.add(row)
-                self.plugins[device.name] = self.plugin_for_device(device)
-
-            self.device_list.show_all()
-            if self.devices:
-                self.device_list.select_row(self.device_list.get_row_at_index(0))
-                # Save discovered capabilities to config
-                self.update_config_devices()
-                # Auto-initialize if enabled
-                if self.config.get("auto_initialize_on_startup", True):
-                    self._logger.info("Auto-initialize scheduled")
-                    # Delay initialization significantly to ensure window is fully stable (2 seconds)
-                    GLib.timeout_add(2000, self._auto_initialize_devices)
+                self._add_device_row(device, previous_plugins)
+
+        @staticmethod
+        def _index_discovered(backend_results):
+            """Index discovered devices by match identifier and by hwmon chip name in one pass."""
+            by_match = {}
+            by_chip = {}  # hwmon chip_name -> device, for config entries whose match changed
+            for backend_class, devices in backend_results:
+                for device in devices:
+                    match_key = getattr(device, 'match', None) or getattr(device, 'name', None)
+                    if match_key:
+                        by_match[match_key] = device
+                    if isinstance(device, HwmonDevice):
+                        by_chip.setdefault(device.chip_name, device)
+            return by_match, by_chip
 
         def update_config_devices(self):
             """Save devices to config with full capabilities."""
-            self.config["devices"] = []
+            devices_cfg = []
             for device in self.devices:
                 if isinstance(device, HwmonDevice):
                     # Save hwmon device info (will be re-detected on load)
-                    self.config["devices"].append({
-                        "name": device.name,
-                        "match": device.match,
-                        "type": "hwmon",
-                        "chip_name": device.chip_name,
-                        "supports_cooling": True,
-                        "supports_lighting": False,
-                    })
+                    entry = dict(zip(_HWMON_CONFIG_KEYS, _HWMON_CONFIG_GETTER(device)))
+                    entry.update(type="hwmon", supports_cooling=True, supports_lighting=False)
                 else:
                     # Save liquidctl device info
-                    self.config["devices"].append({
-                        "name": device.name,
-                        "match": device.match,
-                        "type": device.device_type,
-                        "color_channels": device.color_channels,
-                        "speed_channels": device.speed_channels,
-                        "color_modes": device.color_modes,
-                        "supports_lighting": device.supports_lighting,
-                        "supports_cooling": device.supports_cooling,
-                    })
+                    entry = dict(zip(_DEVICE_CONFIG_KEYS, _DEVICE_CONFIG_GETTER(device)))
+                devices_cfg.append(entry)
+            # Startup re-detection usually finds exactly what is saved already
+            if devices_cfg == self.config.get("devices"):
+                return
+            self.config["devices"] = devices_cfg
             save_config(self.config)
 
         def run_command(self, cmd):
@@ -712,6 +846,10 @@ if GTK_AVAILABLE:
         def detect_devices(self):
             self._logger.info("[ACTION] Detect Devices clicked")
             
+            # Re-probe backend availability (e.g. liquidctl or hwmon appeared since startup)
+            BackendRegistry.invalidate()
+            self.core.refresh_liquidctl_path()
+            
             # Discover devices from all backends (automatic deduplication by priority)
             backend_results = discover_devices()
             
@@ -720,98 +858,154 @@ if GTK_AVAILABLE:
                 caps = backend_class.get_capabilities()
                 self._logger.info("Backend available: %s (priority: %d)", caps.name, caps.priority)
             
-            # Flatten devices from all backends
-            self.devices = []
+            log_details = self._logger.isEnabledFor(logging.DEBUG)
+
+            # Flatten devices from all backends. Results are in priority order,
+            # so the first backend to report a device wins and later copies
+            # never get a plugin or a list row.
+            seen = {}
             for backend_class, devices in backend_results:
                 caps = backend_class.get_capabilities()
                 self._logger.info("Backend %s found %d device(s)", caps.name, len(devices))
                 for device in devices:
                     if isinstance(device, HwmonDevice):
                         self._logger.info("  Hwmon: %s", device.description)
-                        self._logger.debug("    PWM channels: %s", list(device.pwm_channels.keys()))
+                        if log_details:
+                            self._logger.debug("    PWM channels: %s", list(device.pwm_channels.keys()))
                     else:
                         self._logger.info("  Device: %s", device.name)
-                        self._logger.debug("    Color channels: %s", device.color_channels)
-                        self._logger.debug("    Speed channels: %s", device.speed_channels)
-                        self._logger.debug("    Color modes: %s", device.color_modes[:5] if len(device.color_modes) > 5 else device.color_modes)
-                self.devices.extend(devices)
+                        # Skip building the argument lists/slices below at INFO
+                        if log_details:
+                            self._logger.debug("    Color channels: %s", device.color_channels)
+                            self._logger.debug("    Speed channels: %s", device.speed_channels)
+                            self._logger.debug("    Color modes: %s", device.color_modes[:5])
+                    key = self._device_key(device)
+                    if key in seen:
+                        self._logger.debug("  Skipping duplicate %s from %s", key, caps.name)
+                        continue
+                    seen[key] = device
+            self._release_devices()
+            self.devices = list(seen.values())
+            self._cooling_devices = self._filter_cooling_devices()
             
             self._logger.info("Total devices: %d", len(self.devices))
             
-            self.plugins.clear()
+            previous_plugins, self.plugins = self.plugins, {}
 
-            for child in self.device_list.get_children():
-                self.device_list.remove(child)
+            # Refill the sidebar with the view detached so it redraws once
+            self.device_list.set_model(None)
+            self.device_store.clear()
+            try:
+                if not self.devices:
+                    self.device_store.append(["No devices found", None])
+                for device in self.devices:
+                    self._add_device_row(device, previous_plugins)
+            finally:
+                self.device_list.set_model(self.device_store)
 
             if not self.devices:
-                row = Gtk.ListBoxRow()
-                row.add(Gtk.Label(label="No devices found"))
-                self.device_list.add(row)
-                self.device_list.show_all()
                 self.show_empty_state()
                 self.status_label.set_text("No devices detected")
                 return
 
-            for device in self.devices:
-                row = Gtk.ListBoxRow()
-                row.device = device
-                # Use description for hwmon devices, name for others
-                display_name = device.description if isinstance(device, HwmonDevice) else device.name
-                row.add(Gtk.Label(label=display_name, xalign=0))
-                self.device_list.add(row)
-                self.plugins[device.name] = self.plugin_for_device(device)
-
-            self.device_list.show_all()
-            self.device_list.select_row(self.device_list.get_row_at_index(0))
+            self.device_selection.select_path(Gtk.TreePath.new_first())
             self.update_config_devices()
 
+        def _filter_cooling_devices(self):
+            # Only devices with thermal/fan data appear in the status panel
+            return [device for device in self.devices if device.supports_cooling]
+
+        def _release_devices(self):
+            """Close cached sysfs handles held by the current device objects."""
+            for device in self.devices:
+                if isinstance(device, HwmonDevice):
+                    device.close()
+
+        @staticmethod
+        def _device_key(device):
+            """Identity used to deduplicate devices and key self.plugins."""
+            kind = "hwmon" if isinstance(device, HwmonDevice) else getattr(device, "device_type", "generic")
+            return (getattr(device, "match", None) or device.name, kind)
+
+        def _add_device_row(self, device, previous_plugins=None):
+            """Add a device to the sidebar list and create (or reuse) its plugin."""
+            # Use description for hwmon devices, name for others
+            display_name = device.description if isinstance(device, HwmonDevice) else device.name
+            self.device_store.append([display_name, device])
+            key = self._device_key(device)
+            plugin = previous_plugins.get(key) if previous_plugins else None
+            if plugin is not None and type(plugin) is self._plugin_class_for(device):
+                # Same device seen again on re-detect: keep its plugin
+                plugin.rebind(device)
+            else:
+                plugin = self.plugin_for_device(device)
+            self.plugins[key] = plugin
+
+        def _plugin_class_for(self, device):
+            """Return the plugin class matching the device's discovered capabilities."""
+            device_cls = type(device)
+            if device_cls not in self._plugin_cls_cache:
+                self._plugin_cls_cache[device_cls] = next(
+                    (plugin_cls for cls, plugin_cls in _PLUGIN_TABLE if issubclass(device_cls, cls)), None
+                )
+            plugin_cls = self._plugin_cls_cache[device_cls]
+            if plugin_cls is not None:
+                return plugin_cls
+            if device.color_channels or device.speed_channels:
+                return DynamicDevicePlugin
+            # Fallback for devices without discoverable capabilities
+            return GenericStatusPlugin
+
         def plugin_for_device(self, device):
             """Select plugin based on discovered device capabilities (fully dynamic)."""
-            # Check if this is a hwmon device
-            if isinstance(device, HwmonDevice):
-                self._logger.debug("Using HwmonDevicePlugin for %s", device.name)
-                return HwmonDevicePlugin(self, device)
-            elif device.color_channels or device.speed_channels:
-                self._logger.debug("Using DynamicDevicePlugin for %s", device.name)
-                return DynamicDevicePlugin(self, device)
-            # Fallback for devices without discoverable capabilities
-            self._logger.debug("Using GenericStatusPlugin for %s (no capabilities discovered)", device.name)
-            return GenericStatusPlugin(self, device)
+            plugin_cls = self._plugin_class_for(device)
+            self._logger.debug("Using %s for %s", plugin_cls.__name__, device.name)
+            return plugin_cls(self, device)
 
         def show_empty_state(self):
-            for child in self.detail_box.get_children():
-                self.detail_box.remove(child)
+            self._detail_built_for = None
+            self.clear_container(self.detail_box)
             self.add_section_label(self.detail_box, "No devices detected.")
             self.add_section_label(self.detail_box, "Connect a supported device and click 'Detect Devices'.")
             self.detail_box.show_all()
 
-        def on_device_selected(self, listbox, row):
-            if not row or not hasattr(row, "device"):
+        def on_device_selected(self, selection):
+            model, tree_iter = selection.get_selected()
+            if tree_iter is None or model[tree_iter][1] is None:
                 return
-            device = row.device
+            device = model[tree_iter][1]
             self._logger.debug("[UI] Device selected: %s", device.name)
             self.selected_device = device
-            plugin = self.plugins.get(device.name)
+            plugin = self.plugins.get(self._device_key(device))
             if not plugin:
                 return
+            # Re-selecting the device already on screen keeps its widgets
+            if device is self._detail_built_for:
+                return
 
-            for child in self.detail_box.get_children():
-                self.detail_box.remove(child)
-
-            plugin.build_ui(self.detail_box)
+            # Rebuild the detail page with child notifications batched and a
+            # single show_all once every widget is attached
+            self.detail_box.freeze_child_notify()
+            try:
+                self.clear_container(self.detail_box)
+                plugin.build_ui(self.detail_box)
+            finally:
+                self.detail_box.thaw_child_notify()
             self.detail_box.show_all()
+            self._detail_built_for = device
             # Status panel now shows all devices, no need to refresh individual device
 
         def on_device_list_button_press(self, widget, event):
             """Handle right-click on device list to show context menu."""
             if event.type == Gdk.EventType.BUTTON_PRESS and event.button == 3:  # Right-click
                 # Get the row at the click position
-                row = self.device_list.get_row_at_y(int(event.y))
-                if row and hasattr(row, "device"):
+                hit = self.device_list.get_path_at_pos(int(event.x), int(event.y))
+                device = self.device_store[hit[0]][1] if hit else None
+                if device is not None:
                     # Select the row
-                    self.device_list.select_row(row)
+                    self.device_selection.select_path(hit[0])
                     # Show context menu
-                    self.show_device_context_menu(row.device, event)
+                    self.show_device_context_menu(device, event)
                 return True
             return False
 
@@ -829,7 +1023,7 @@ if GTK_AVAILABLE:
         def initialize_device(self, device):
             """Initialize a specific device."""
             self._logger.info("[ACTION] Initialize device: %s", device.name)
-            plugin = self.plugins.get(device.name)
+            plugin = self.plugins.get(self._device_key(device))
             if plugin:
                 plugin.initialize()
                 self.status_label.set_text(f"Initialized {device.name}")
@@ -838,7 +1032,7 @@ if GTK_AVAILABLE:
             if not self.selected_device:
                 return
             self._logger.info("[ACTION] Initialize Selected clicked for %s", self.selected_device.name)
-            plugin = self.plugins.get(self.selected_device.name)
+            plugin = self.plugins.get(self._device_key(self.selected_device))
             if plugin:
                 plugin.initialize()
                 self.status_label.set_text(f"Initialized {self.selected_device.name}")
@@ -873,92 +1067,250 @@ if GTK_AVAILABLE:
         def set_speed(self, device_match, channel, speed):
             return self.device_controller.set_speed(device_match, channel, speed)
 
+        def run_in_background(self, func, callback, *args, on_error=None, executor=None):
+            """Run func(*args) on the worker pool and hand the result to callback on the GTK main loop.
+
+            on_error, if given, is called on the main loop with the exception instead.
+            executor overrides the default pool (self._executor).
+            """
+            future = (executor or self._executor).submit(func, *args)
+            future.add_done_callback(
+                lambda f: GLib.idle_add(self._finish_background, f, callback, on_error)
+            )
+            return future
+
+        def _finish_background(self, future, callback, on_error=None):
+            # Safety check: the window may have closed while the worker ran
+            if not self.get_window() or future.cancelled():
+                return False
+            exc = future.exception()
+            if exc is not None:
+                self._logger.error("Background task failed: %s", exc)
+                if on_error:
+                    on_error(exc)
+                return False
+            callback(future.result())
+            return False
+
         def refresh_status(self):
             # Safety check: don't refresh if window is destroyed
             if not self.get_window():
                 return
-            
-            # Collect status from all devices with thermal/fan data
-            # Order: CPU → Coolers → GPU
-            all_status = []
-            
-            # 1. CPU/System sensors first (lm-sensors)
+            # Nobody is looking: keep a slow timer ticking but skip the I/O.
+            # Restoring the window triggers an immediate refresh.
+            if not self._is_visible or not self.get_mapped():
+                self._schedule_status_refresh(HIDDEN_REFRESH_SECONDS)
+                return
+            # A slow poll is still running; its completion re-arms the timer
+            if self._status_refresh_in_flight:
+                return
+            # Sensor and device reads block on USB/subprocess I/O, so do them
+            # on the worker pool and only touch GTK when the text is ready.
+            polled = [(device, self._device_refresh_interval(device)) for device in self._cooling_devices]
+            self._status_refresh_in_flight = True
+            self.run_in_background(
+                self._collect_status, self._apply_status, polled, on_error=self._on_status_refresh_error
+            )
+
+        def _on_status_refresh_error(self, exc):
+            # Keep monitoring alive after an unexpected failure
+            self._status_refresh_in_flight = False
+            self._schedule_status_refresh(AUTO_REFRESH_SECONDS)
+
+        def _device_refresh_interval(self, device):
+            plugin = self.plugins.get(self._device_key(device))
+            return plugin.refresh_interval if plugin else AUTO_REFRESH_SECONDS
+
+        def _section_due(self, key, now):
+            return key not in self._status_sections or now >= self._status_due.get(key, 0.0)
+
+        def _status_section(self, key, interval, now, read):
+            """Return the cached text for a status section, re-reading it once interval has elapsed."""
+            if not self._section_due(key, now):
+                return self._status_sections[key]
+            text = read()
+            self._status_sections[key] = text
+            self._status_due[key] = now + interval
+            return text
+
+        def _read_sensors_section(self):
             sensors_data = sensors_api.get_lm_sensors()
             if sensors_data:
-                all_status.append(f"┌─ System Sensors (lm-sensors) ─\n{sensors_data}\n")
-            
-            # 2. Liquidctl cooling devices (Kraken, etc.)
-            for device in self.devices:
-                # Only show devices that support cooling (have thermal/fan data)
-                if device.supports_cooling:
-                    try:
-                        # Handle hwmon devices differently
-                        if isinstance(device, HwmonDevice):
-                            status_data = device.get_status()
-                            if status_data:
-                                status_lines = [f"{metric:20s} {value:>6s} {unit}" for metric, value, unit in status_data]
-                                status = "\n".join(status_lines)
-                                all_status.append(f"┌─ {device.description} ─\n{status}\n")
-                        else:
-                            # Regular liquidctl device
-                            status, _ = self.core.get_status(device.match)
-                            if status:
-                                # Format numbers to 1 decimal place
-                                status = re.sub(r'(\d+\.\d{2,})', lambda m: f"{float(m.group(1)):.1f}", status)
-                                all_status.append(f"┌─ {device.name} ─\n{status}\n")
-                    except Exception:
-                        logging.exception("Refresh failed for %s", device.name)
-            
-            # 3. GPU sensors last (NVIDIA/AMD)
+                return f"┌─ System Sensors (lm-sensors) ─\n{sensors_data}\n"
+            return None
+
+        def _read_gpu_section(self):
             gpu_data = sensors_api.get_gpu_info()
             if gpu_data:
-                all_status.append(f"┌─ GPU Sensors ─\n{gpu_data}\n")
-            
-            # Update status buffer with all device info (join with blank line separator)
-            if all_status and self.status_buffer:
-                self.status_buffer.set_text("\n".join(all_status).rstrip())
-            elif self.status_buffer:
-                self.status_buffer.set_text("No devices with thermal/fan monitoring available")
+                return f"┌─ GPU Sensors ─\n{gpu_data}\n"
+            return None
 
-            if self.status_buffer:
+        def _read_device_section(self, device):
+            try:
+                # Handle hwmon devices differently
+                if isinstance(device, HwmonDevice):
+                    status_data = device.get_status()
+                    if status_data:
+                        # Header, rows and trailing newline in one join
+                        lines = [f"┌─ {device.description} ─"]
+                        lines.extend(f"{metric:20s} {value:>6s} {unit}" for metric, value, unit in status_data)
+                        lines.append("")
+                        return "\n".join(lines)
+                else:
+                    # Regular liquidctl device
+                    status, _ = self.core.get_status(device.match)
+                    if status:
+                        # Format numbers to 1 decimal place
+                        status = _round_decimals(status)
+                        return f"┌─ {device.name} ─\n{status}\n"
+            except Exception:
+                self._logger.exception("Refresh failed for %s", device.name)
+            return None
+
+        def _start_device_read(self, key, device):
+            # A read that timed out last tick may still be running; wait on it
+            # again instead of queueing another one behind the device lock.
+            future = self._device_reads.get(key)
+            if future is None or future.done():
+                future = self._device_executor.submit(self._read_device_section, device)
+                self._device_reads[key] = future
+            return future
+
+        def _await_device_section(self, key, future):
+            try:
+                return future.result(timeout=DEVICE_STATUS_TIMEOUT_SECONDS)
+            except concurrent.futures.TimeoutError:
+                # Keep showing the last reading rather than holding up the panel
+                self._logger.warning("Status read for %s timed out", key[0])
+                return self._status_sections.get(key)
+
+        def _collect_status(self, polled):
+            """Gather status text from sensors and devices (runs off the GTK main thread)."""
+            # Collect status from all devices with thermal/fan data
+            # Order: CPU → Coolers → GPU. Each section keeps its last reading
+            # until its own refresh interval has elapsed.
+            now = time.monotonic()
+
+            # polled only holds cooling devices (see _filter_cooling_devices)
+            cooling = [
+                (device, self._device_key(device), interval)
+                for device, interval in polled
+                if interval is not None
+            ]
+            # Start every due device read up front so their USB/sysfs
+            # round-trips overlap each other and the lm-sensors call.
+            pending = {
+                key: self._start_device_read(key, device)
+                for device, key, interval in cooling
+                if self._section_due(key, now)
+            }
+
+            # 1. CPU/System sensors first (lm-sensors)
+            sections = [self._status_section("lm-sensors", AUTO_REFRESH_SECONDS, now, self._read_sensors_section)]
+
+            # 2. Liquidctl cooling devices (Kraken, etc.), in display order
+            for device, key, interval in cooling:
+                sections.append(self._status_section(
+                    key, interval, now, functools.partial(self._await_device_section, key, pending.get(key))
+                ))
+
+            # 3. GPU sensors last (NVIDIA/AMD)
+            sections.append(self._status_section("gpu", AUTO_REFRESH_SECONDS, now, self._read_gpu_section))
+
+            # Wake up again when the earliest of these sections comes due
+            polled_keys = ["lm-sensors", "gpu"] + [key for _device, key, _interval in cooling]
+            next_due = min(self._status_due[key] for key in polled_keys)
+
+            all_status = [section for section in sections if section]
+            if all_status:
+                return "\n".join(all_status).rstrip(), next_due
+            return "No devices with thermal/fan monitoring available", next_due
+
+        def _apply_status(self, result):
+            self._status_refresh_in_flight = False
+            text, next_due = result
+            # Update status buffer with all device info, skipping the
+            # redraw when the text is identical to the last poll
+            if self.status_buffer and text != self._last_status_text:
+                self._last_status_text = text
+                _set_buffer_text(self.status_buffer, text)
                 GLib.idle_add(self._resize_status_panel_to_content)
 
-            # Schedule next refresh for continuous monitoring (cancel any existing timer first)
+            # Each section keeps its own interval, so sleep until the next one is due
+            self._schedule_status_refresh(next_due - time.monotonic())
+
+        def _schedule_status_refresh(self, delay):
+            # A single one-shot source drives monitoring; re-arming replaces it
             if self.refresh_id:
                 GLib.source_remove(self.refresh_id)
-                self.refresh_id = None
-            self.refresh_id = GLib.timeout_add_seconds(AUTO_REFRESH_SECONDS, self._refresh_status_timeout)
-            self._logger.debug("Status refreshed, next refresh in %d seconds", AUTO_REFRESH_SECONDS)
-
-
+            delay_ms = max(int(delay * 1000), MIN_REFRESH_DELAY_MS)
+            self.refresh_id = GLib.timeout_add(delay_ms, self._refresh_status_timeout)
+            self._logger.debug("Next status refresh in %d ms", delay_ms)
+
+        def _on_window_state_event(self, widget, event):
+            hidden_states = Gdk.WindowState.WITHDRAWN | Gdk.WindowState.ICONIFIED
+            was_visible = self._is_visible
+            self._is_visible = not (event.new_window_state & hidden_states)
+            if self._is_visible and not was_visible:
+                # Show fresh readings straight away instead of waiting a tick
+                self.refresh_status()
+            return False
 
         def _refresh_status_timeout(self):
+            # One-shot: refresh_status (or the poll it starts) arms the next wakeup
+            self.refresh_id = None
             # Safety check: don't refresh if window is destroyed
-            if not self.get_window():
-                return False
-            self.refresh_status()
+            if self.get_window():
+                self.refresh_status()
             return False
 
-        def pick_color(self, device_match, channel):
+        def pick_color(self, device_match, channel, _button=None):
+            self._pending_preset_writes.pop(("color", device_match, channel), None)
             self.device_controller.pick_color(device_match, channel)
 
-        def apply_preset_color(self, device_match, channel, color_hex):
-            self.device_controller.apply_preset_color(device_match, channel, color_hex)
+        def apply_preset_color(self, device_match, channel, color_hex, _button=None):
+            self._queue_preset_write(
+                ("color", device_match, channel),
+                functools.partial(self.device_controller.apply_preset_color, device_match, channel, color_hex),
+            )
 
-        def apply_mode_dynamic(self, device_match, channel, combo):
+        def apply_mode_dynamic(self, device_match, channel, combo, _button=None):
             """Apply mode using the new core API (for dynamic plugin)."""
+            self._pending_preset_writes.pop(("color", device_match, channel), None)
             self.device_controller.apply_mode_dynamic(device_match, channel, combo)
 
         def apply_speed(self, device_match, channel, speed):
+            # An explicit Apply supersedes a preset still waiting to be sent
+            self._pending_preset_writes.pop(("speed", device_match, channel), None)
             self.device_controller.apply_speed(device_match, channel, speed)
 
-        def apply_speed_preset(self, device_match, channel, speed, scale):
-            self.device_controller.apply_speed_preset(device_match, channel, speed, scale)
+        def apply_speed_preset(self, device_match, channel, speed, scale, _button=None):
+            self._queue_preset_write(
+                ("speed", device_match, channel),
+                functools.partial(self.device_controller.apply_speed_preset, device_match, channel, speed, scale),
+            )
         
         def apply_hwmon_speed(self, device_match, channel, speed):
             """Apply speed to hwmon (motherboard PWM) device."""
+            self._pending_preset_writes.pop(("speed", device_match, channel), None)
             self.device_controller.apply_hwmon_speed(device_match, channel, speed)
 
+        def _queue_preset_write(self, key, write):
+            """Send write after PRESET_WRITE_DELAY_MS; later clicks for key replace it."""
+            # Like the window-state save: arm one timeout per key and let
+            # further clicks only swap the write it will perform.
+            armed = key in self._pending_preset_writes
+            self._pending_preset_writes[key] = write
+            if not armed:
+                GLib.timeout_add(PRESET_WRITE_DELAY_MS, self._flush_preset_write, key)
+
+        def _flush_preset_write(self, key):
+            write = self._pending_preset_writes.pop(key, None)
+            # Safety check: the window may have closed while the click was pending
+            if write is not None and self.get_window():
+                write()
+            return False
+
         def save_profile(self):
             self.profile_manager.save_profile()
 
@@ -981,13 +1333,18 @@ if GTK_AVAILABLE:
             if not self.get_window():
                 return
             
-            # Trigger UI rebuild by re-selecting the current device
             if self.selected_device:
-                # Get the currently selected row
-                selected_row = self.device_list.get_selected_row()
-                if selected_row:
-                    # Re-trigger selection to rebuild UI
-                    self.on_device_selected(self.device_list, selected_row)
+                plugin = self.plugins.get(self._device_key(self.selected_device))
+                # Update sliders in place when the page is already built;
+                # otherwise rebuild it by re-selecting the current device
+                refreshed = (
+                    plugin is not None
+                    and self._detail_built_for is self.selected_device
+                    and plugin.refresh_values()
+                )
+                if not refreshed and self.device_selection.count_selected_rows():
+                    self._detail_built_for = None
+                    self.on_device_selected(self.device_selection)
             # Also refresh status
             self.refresh_status()
             # Update profile indicator
@@ -1002,12 +1359,25 @@ if GTK_AVAILABLE:
             self.profile_manager.mark_profile_modified()
 
         def _auto_save_state(self):
-            """Automatically save current state for session restore."""
-            self.profile_manager.auto_save_state()
+            """Automatically save current state for session restore.
+
+            The modified marker is set right away; the write itself is
+            deferred so a burst of slider steps produces a single save.
+            """
+            self._mark_profile_modified()
+            if self._state_save_id is None:
+                self._state_save_id = GLib.timeout_add(STATE_SAVE_DELAY_MS, self._flush_state_save)
+
+        def _flush_state_save(self):
+            self._state_save_id = None
+            self.profile_manager.write_current_state()
+            return False
 
         def get_saved_speed(self, device_match, channel):
-            fallback = str(self.get_config_int("default_speed", DEFAULT_SPEED))
-            return int(self.last_speeds.get(f"{device_match}:{channel}", fallback))
+            speed = self.last_speeds.get(f"{device_match}:{channel}")
+            if speed is not None:
+                return int(speed)
+            return self._default_speed
 
         def choose_color(self, title):
             dialog = Gtk.ColorChooserDialog(title=title, parent=self)
@@ -1019,10 +1389,7 @@ if GTK_AVAILABLE:
             return self.rgba_to_hex(color)
 
         def rgba_to_hex(self, rgba):
-            r = int(rgba.red * 255)
-            g = int(rgba.green * 255)
-            b = int(rgba.blue * 255)
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return "#" + bytes((int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255))).hex()
 
         def show_error(self, message):
             dialog = Gtk.MessageDialog(
@@ -1049,7 +1416,15 @@ if GTK_AVAILABLE:
             dialog.destroy()
 
         def show_about(self):
-            """Show custom About dialog."""
+            """Show custom About dialog (built on first use, then reused)."""
+            if self._about_dialog is None:
+                self._about_dialog = self._build_about_dialog()
+            self._about_dialog.show_all()
+            self._about_dialog.run()
+            self._about_dialog.hide()
+
+        def _build_about_dialog(self):
+            """Construct the About dialog widget tree once."""
             dialog = Gtk.Dialog(
                 title="About Liquidctl GUI",
                 transient_for=self,
@@ -1149,13 +1524,60 @@ if GTK_AVAILABLE:
             credits_box.pack_start(license_label, False, False, 0)
             
             content.pack_start(credits_box, True, True, 0)
-            
-            dialog.show_all()
-            dialog.run()
-            dialog.destroy()
+            return dialog
 
         def show_settings(self):
             """Show settings dialog for user preferences."""
+            if self._settings_dialog is None:
+                self._settings_dialog = self._build_settings_dialog()
+            dialog = self._settings_dialog
+            startup_toggle = dialog.startup_toggle
+            log_combo = dialog.log_combo
+
+            # Reset the reused widgets to the current settings. The toggle
+            # shows the saved value and stays locked until systemctl reports
+            # the real state, so the dialog opens without waiting on it.
+            startup_toggle.set_active(bool(self.config.get("launch_on_boot", False)))
+            startup_toggle.set_sensitive(False)
+            dialog.startup_note.hide()
+            self.run_in_background(get_startup_enabled, self._update_startup_toggle)
+
+            current_level = str(self.config.get("log_level", "INFO")).upper()
+            log_combo.set_active(LOG_LEVELS.index(current_level) if current_level in LOG_LEVELS else 2)
+
+            dialog.show_all()
+            response = dialog.run()
+            dialog.hide()
+            if response == Gtk.ResponseType.OK:
+                selected = log_combo.get_active_text() or "INFO"
+                self.config["log_level"] = selected
+                desired_startup = startup_toggle.get_active()
+                if desired_startup != bool(self.config.get("launch_on_boot", False)):
+                    if desired_startup:
+                        ok, err = enable_startup()
+                    else:
+                        ok, err = disable_startup()
+                    if not ok:
+                        self.show_error(err or "Failed to update startup setting")
+                    else:
+                        self.config["launch_on_boot"] = desired_startup
+                save_config(self.config)
+                self._apply_log_level()
+
+        def _update_startup_toggle(self, result):
+            dialog = self._settings_dialog
+            if dialog is None or not dialog.get_visible():
+                return
+            startup_enabled, startup_error = result
+            if startup_error is None:
+                dialog.startup_toggle.set_active(startup_enabled)
+                dialog.startup_toggle.set_sensitive(True)
+            else:
+                dialog.startup_note.set_text(f"Startup service unavailable: {startup_error}")
+                dialog.startup_note.show()
+
+        def _build_settings_dialog(self):
+            """Construct the Settings dialog; show_settings fills in the values."""
             dialog = Gtk.Dialog(
                 title="Settings",
                 transient_for=self,
@@ -1175,19 +1597,15 @@ if GTK_AVAILABLE:
             startup_label = Gtk.Label(label="Apply Profile at Boot")
             startup_label.set_xalign(0)
             startup_row.pack_start(startup_label, True, True, 0)
-            startup_toggle = Gtk.CheckButton()
-            startup_toggle.set_active(bool(self.config.get("launch_on_boot", False)))
-            startup_row.pack_start(startup_toggle, False, False, 0)
+            dialog.startup_toggle = Gtk.CheckButton()
+            startup_row.pack_start(dialog.startup_toggle, False, False, 0)
 
-            startup_enabled, startup_error = get_startup_enabled()
-            if startup_error is None:
-                startup_toggle.set_active(startup_enabled)
-            else:
-                startup_toggle.set_sensitive(False)
-                startup_note = Gtk.Label(label=f"Startup service unavailable: {startup_error}")
-                startup_note.set_xalign(0)
-                startup_note.set_line_wrap(True)
-                content.pack_start(startup_note, False, False, 0)
+            # Only shown when the startup service cannot be queried
+            dialog.startup_note = Gtk.Label()
+            dialog.startup_note.set_xalign(0)
+            dialog.startup_note.set_line_wrap(True)
+            dialog.startup_note.set_no_show_all(True)
+            content.pack_start(dialog.startup_note, False, False, 0)
 
             log_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
             content.pack_start(log_row, False, False, 0)
@@ -1195,13 +1613,10 @@ if GTK_AVAILABLE:
             log_label.set_xalign(0)
             log_row.pack_start(log_label, True, True, 0)
 
-            log_levels = ["ERROR", "WARNING", "INFO", "DEBUG"]
-            current_level = str(self.config.get("log_level", "INFO")).upper()
-            log_combo = Gtk.ComboBoxText()
-            for level in log_levels:
-                log_combo.append_text(level)
-            log_combo.set_active(log_levels.index(current_level) if current_level in log_levels else 2)
-            log_row.pack_start(log_combo, False, False, 0)
+            dialog.log_combo = Gtk.ComboBoxText()
+            for level in LOG_LEVELS:
+                dialog.log_combo.append_text(level)
+            log_row.pack_start(dialog.log_combo, False, False, 0)
 
             note = Gtk.Label(
                 label="Changes apply immediately. Environment variable LIQUIDCTL_GUI_LOG_LEVEL overrides this setting."
@@ -1210,25 +1625,7 @@ if GTK_AVAILABLE:
             note.set_line_wrap(True)
             note.set_margin_top(6)
             content.pack_start(note, False, False, 0)
-
-            dialog.show_all()
-            response = dialog.run()
-            if response == Gtk.ResponseType.OK:
-                selected = log_combo.get_active_text() or "INFO"
-                self.config["log_level"] = selected
-                desired_startup = startup_toggle.get_active()
-                if desired_startup != bool(self.config.get("launch_on_boot", False)):
-                    if desired_startup:
-                        ok, err = enable_startup()
-                    else:
-                        ok, err = disable_startup()
-                    if not ok:
-                        self.show_error(err or "Failed to update startup setting")
-                    else:
-                        self.config["launch_on_boot"] = desired_startup
-                save_config(self.config)
-                self._apply_log_level()
-            dialog.destroy()
+            return dialog
 
         def _apply_log_level(self):
             level = _resolve_log_level(self.config)
@@ -1244,6 +1641,23 @@ if GTK_AVAILABLE:
             if self.refresh_id:
                 GLib.source_remove(self.refresh_id)
                 self.refresh_id = None
+            # Persist any resize/drag still waiting on the save delay
+            if self._window_state_save_id is not None:
+                GLib.source_remove(self._window_state_save_id)
+                self._flush_window_state_save()
+            # Write out a settings change still waiting on the save delay
+            if self._state_save_id is not None:
+                GLib.source_remove(self._state_save_id)
+                self._flush_state_save()
+            for dialog in (self._about_dialog, self._settings_dialog):
+                if dialog is not None:
+                    dialog.destroy()
+            self._about_dialog = self._settings_dialog = None
+            # Drop queued status reads; running ones finish and are ignored
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._device_executor.shutdown(wait=False, cancel_futures=True)
+            self._init_executor.shutdown(wait=False, cancel_futures=True)
+            self._release_devices()
             self._logger.info("Window destroyed, cleanup complete")
 
         def _auto_initialize_devices(self):
@@ -1259,46 +1673,66 @@ if GTK_AVAILABLE:
                 return False
             
             try:
-                self._logger.info("Starting staggered initialization of %d device(s)", len(self.plugins))
+                plugins = [(plugin.device.name, plugin) for plugin in self.plugins.values()]
+                self._logger.info("Starting background initialization of %d device(s)", len(plugins))
                 self.status_label.set_text("Initializing devices...")
-                
-                # Stagger device initialization to avoid blocking GTK event loop
-                # Initialize one device at a time with delays between them
-                devices_to_init = list(self.plugins.items())
-                self._init_next_device(devices_to_init, 0)
+                self._init_pending = len(plugins)
+                self._init_total = len(plugins)
+                if not plugins:
+                    self._on_all_devices_initialized()
+
+                # Device initialization does USB/sysfs I/O; run it on the
+                # init pool (bounded at four) so independent devices
+                # initialize concurrently and GTK stays responsive.
+                for name, plugin in plugins:
+                    self.run_in_background(
+                        self._run_plugin_initialize,
+                        functools.partial(self._on_device_initialized, name, plugin),
+                        name,
+                        plugin,
+                        executor=self._init_executor,
+                    )
                     
             except Exception:
                 self._logger.exception("Auto-initialization failed")
                 self.status_label.set_text("Initialization failed")
             return False  # Don't repeat
 
-        def _init_next_device(self, devices_list, index):
-            """Initialize devices one at a time with delays (non-blocking)."""
-            if not self.get_window():
-                return False
-                
-            if index >= len(devices_list):
-                # All devices initialized
-                self._logger.info("All devices initialized")
-                self.status_label.set_text("Devices initialized")
-                
-                # Reapply profile after all devices are initialized
-                if self.last_colors or self.last_modes or self.last_speeds:
-                    GLib.timeout_add(500, self._reapply_profile_after_init)
-                return False
-            
-            # Initialize this device
-            name, plugin = devices_list[index]
+        def _run_plugin_initialize(self, name, plugin):
             try:
-                self._logger.info("Initializing device %d/%d: %s", index + 1, len(devices_list), name)
-                self.status_label.set_text(f"Initializing {name}... ({index + 1}/{len(devices_list)})")
-                plugin.initialize()
-            except Exception as e:
+                self._logger.info("Initializing device: %s", name)
+                return plugin.run_initialize()
+            except Exception:
                 self._logger.exception("Failed to initialize %s", name)
-            
-            # Schedule next device (300ms delay between devices to let GTK breathe)
-            GLib.timeout_add(300, lambda: self._init_next_device(devices_list, index + 1))
-            return False
+                return None
+
+        def _on_device_initialized(self, name, plugin, outcome):
+            if outcome is not None:
+                plugin.report_initialize(outcome)
+            self._init_pending -= 1
+            if self._init_pending <= 0:
+                self._on_all_devices_initialized()
+            else:
+                done = self._init_total - self._init_pending
+                self.status_label.set_text(f"Initializing devices... ({done}/{self._init_total})")
+
+        def _on_all_devices_initialized(self):
+            self._logger.info("All devices initialized")
+            self.status_label.set_text("Devices initialized")
+
+            # Reapply profile after all devices are initialized, unless the
+            # saved state only references devices that are no longer present
+            if self._has_applicable_profile_state():
+                GLib.timeout_add(500, self._reapply_profile_after_init)
+
+        def _has_applicable_profile_state(self):
+            """Return True if any saved "match:channel" key targets a current device."""
+            current_matches = {device.match for device in self.devices}
+            # rpartition keeps hwmon matches ("hwmon:<chip>") intact
+            return any(
+                key.rpartition(":")[0] in current_matches
+                for key in itertools.chain(self.last_colors, self.last_modes, self.last_speeds)
+            )
 
         def _reapply_profile_after_init(self):
             """Reapply loaded profile after initialization (separate callback)."""
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from .lib.config import load_config, load_current_state
+from .lib.error_handler import is_device_not_found
 from .lib.functions import LiquidctlCore
+from .lib.liquidctl_api import GLOBAL_SYNC_MODES, MODES_WITHOUT_COLOR
 
 
 DEFAULT_CONFIG = {
     "auto_initialize_on_startup": True,
+    "parallel_initialize": True,
     "log_level": "INFO",
 }
 
+MAX_INIT_WORKERS = 8  # Upper bound on devices initialized concurrently
+
 
 def _resolve_log_level(config: Dict) -> int:
     env_level = os.environ.get("LIQUIDCTL_GUI_LOG_LEVEL", "").strip()
@@ -30,19 +36,8 @@ class HeadlessApplier:
         self.last_colors: Dict[str, str] = {}
         self.last_modes: Dict[str, str] = {}
         self.last_speeds: Dict[str, str] = {}
-        self.global_sync_modes = {
-            "spectrum-wave", "color-cycle", "rainbow-flow", "super-rainbow",
-            "rainbow-pulse", "covering-marquee", "marquee-3", "marquee-4",
-            "marquee-5", "marquee-6", "moving-alternating-3", "moving-alternating-4",
-            "moving-alternating-5", "alternating-3", "alternating-4", "alternating-5",
-        }
-        self.modes_without_color = {
-            "spectrum-wave", "color-cycle", "off", "marquee-3", "marquee-4",
-            "marquee-5", "marquee-6", "covering-marquee", "alternating-3",
-            "alternating-4", "alternating-5", "moving-alternating-3",
-            "moving-alternating-4", "moving-alternating-5", "rainbow-flow",
-            "super-rainbow", "rainbow-pulse",
-        }
+        self.global_sync_modes = GLOBAL_SYNC_MODES
+        self.modes_without_color = MODES_WITHOUT_COLOR
 
     def _set_led_color(self, device_match: str, channel: str, color_hex: str) -> Tuple[bool, str]:
         success, err = self.core.set_color(device_match, channel, "fixed", color_hex)
@@ -61,116 +56,94 @@ class HeadlessApplier:
         return bool(success), err
 
     def apply_profile_data(self, data: Dict) -> None:
+        # Connect each device once for the whole apply, not once per channel
+        with self.core.device_sessions(_collect_device_matches(data)):
+            self._apply_profile_data(data)
+
+    def _apply_profile_data(self, data: Dict) -> None:
         self.last_colors = data.get("colors", {}).copy()
         self.last_modes = data.get("modes", {}).copy()
         self.last_speeds = data.get("speeds", {}).copy()
 
+        # Devices that reported "not found"; their remaining operations are skipped
+        unavailable = set()
+        for op in self._plan_operations():
+            device = op[2]
+            if device in unavailable:
+                continue
+            if not self._dispatch(*op):
+                unavailable.add(device)
+
+    def _plan_operations(self) -> List[Tuple]:
+        """Order the profile writes: sync modes, channel modes, color-only channels, speeds.
+
+        Each operation is (label, key, device, setter, args, value), where value
+        is only used for logging.
+        """
+        log = self._logger
+        global_sync_modes = self.global_sync_modes
+        no_color = self.modes_without_color
+        last_colors = self.last_colors
         devices_with_global_sync = set()
-        sync_modes = {}
-        regular_modes = {}
+        ops = []  # Sync modes; channel modes are appended once global sync is known
+        mode_ops = []
 
+        # One pass over the modes builds the finished operations
         for key, mode in self.last_modes.items():
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
+            color_hex = last_colors.get(key, "")
+            if mode in no_color or not color_hex:
+                setter, args = self._set_led_mode, (device, channel, mode)
+            else:
+                setter, args = self._set_led_mode_with_color, (device, channel, mode, color_hex)
             if channel == "sync":
-                sync_modes[key] = mode
-                if mode in self.global_sync_modes:
+                ops.append(("sync mode", key, device, setter, args, mode))
+                if mode in global_sync_modes:
                     devices_with_global_sync.add(device)
-                    self._logger.info(
-                        "Device %s has global sync mode: %s (will skip individual LEDs)",
-                        device,
-                        mode,
-                    )
+                    log.info("Device %s has global sync mode: %s (will skip individual LEDs)", device, mode)
             else:
-                regular_modes[key] = mode
-
-        for key, mode in sync_modes.items():
-            device, channel = key.split(":", 1)
-            color_hex = self.last_colors.get(key, "")
-
-            try:
-                if mode in self.modes_without_color or not color_hex:
-                    success, err = self._set_led_mode(device, channel, mode)
-                else:
-                    success, err = self._set_led_mode_with_color(device, channel, mode, color_hex)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                    continue
-                if not success:
-                    self._logger.warning("Failed to apply sync mode %s for %s: %s", mode, key, err)
-            except Exception as exc:
-                if "not found" in str(exc).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                else:
-                    self._logger.warning("Failed to apply sync mode %s for %s: %s", mode, key, exc)
-
-        for key, mode in regular_modes.items():
-            device, channel = key.split(":", 1)
-            if device in devices_with_global_sync:
-                self._logger.debug("Skipping individual LED %s (device has global sync effect)", key)
+                mode_ops.append(("mode", key, device, setter, args, mode))
+
+        for op in mode_ops:
+            if op[2] in devices_with_global_sync:
+                log.debug("Skipping individual LED %s (device has global sync effect)", op[1])
                 continue
-            color_hex = self.last_colors.get(key, "")
-
-            try:
-                if mode in self.modes_without_color or not color_hex:
-                    success, err = self._set_led_mode(device, channel, mode)
-                else:
-                    success, err = self._set_led_mode_with_color(device, channel, mode, color_hex)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                    continue
-                if not success:
-                    self._logger.warning("Failed to apply mode %s for %s: %s", mode, key, err)
-            except Exception as exc:
-                if "not found" in str(exc).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                else:
-                    self._logger.warning("Failed to apply mode %s for %s: %s", mode, key, exc)
-
-        for key, color_hex in self.last_colors.items():
+            ops.append(op)
+
+        for key, color_hex in last_colors.items():
             if not color_hex or key in self.last_modes:
                 continue
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
             if device in devices_with_global_sync:
-                self._logger.debug("Skipping color-only LED %s (device has global sync effect)", key)
+                log.debug("Skipping color-only LED %s (device has global sync effect)", key)
                 continue
-            try:
-                success, err = self._set_led_color(device, channel, color_hex)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                    continue
-                if not success:
-                    self._logger.warning("Failed to apply color %s for %s: %s", color_hex, key, err)
-            except Exception as exc:
-                if "not found" in str(exc).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                else:
-                    self._logger.warning("Failed to apply color %s for %s: %s", color_hex, key, exc)
+            ops.append(("color", key, device, self._set_led_color, (device, channel, color_hex), color_hex))
 
         for key, speed in self.last_speeds.items():
-            device, channel = key.split(":", 1)
-            try:
-                success, err = self._set_speed(device, channel, speed)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                    continue
-                if not success:
-                    self._logger.warning("Failed to apply speed %s for %s: %s", speed, key, err)
-            except Exception as exc:
-                if "not found" in str(exc).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
-                else:
-                    self._logger.warning("Failed to apply speed %s for %s: %s", speed, key, exc)
+            device, _, channel = key.partition(":")
+            ops.append(("speed", key, device, self._set_speed, (device, channel, speed), speed))
+        return ops
+
+    def _dispatch(self, label: str, key: str, device: str, setter, args: Tuple, value) -> bool:
+        """Run one planned write; return False if the device is unavailable."""
+        try:
+            success, err = setter(*args)
+        except Exception as exc:
+            success, err = False, exc
+        if is_device_not_found(err):
+            self._logger.debug("Skipping unavailable device: %s", device)
+            return False
+        if not success:
+            self._logger.warning("Failed to apply %s %s for %s: %s", label, value, key, err)
+        return True
 
 
 def _collect_device_matches(state: Dict) -> list[str]:
-    matches = set()
-    for key in state.get("colors", {}):
-        matches.add(key.split(":", 1)[0])
-    for key in state.get("modes", {}):
-        matches.add(key.split(":", 1)[0])
-    for key in state.get("speeds", {}):
-        matches.add(key.split(":", 1)[0])
-    return sorted(matches)
+    return sorted({
+        key.partition(":")[0]
+        for section in ("colors", "modes", "speeds")
+        for key in state.get(section, {})
+    })
 
 
 def main() -> int:
@@ -193,19 +166,27 @@ def main() -> int:
         return 1
 
     matches = _collect_device_matches(state)
-    if config.get("auto_initialize_on_startup", True) and matches:
-        for match in matches:
-            result, err = core.initialize(match)
-            if err and "not found" in err.lower():
-                logger.debug("Skipping initialization of unavailable device: %s", match)
-                continue
-            if err:
-                logger.warning("Initialization failed for %s: %s", match, err)
-            elif result:
-                logger.debug("Initialized %s: %s", match, result)
+    # One connection per device covers initialization and the profile apply
+    with core.device_sessions(matches):
+        if config.get("auto_initialize_on_startup", True) and matches:
+            # Devices are independent, so initialize them concurrently; results
+            # are logged afterwards in match order to keep the log readable
+            if config.get("parallel_initialize", True) and len(matches) > 1:
+                with ThreadPoolExecutor(max_workers=min(MAX_INIT_WORKERS, len(matches))) as executor:
+                    results = list(executor.map(core.initialize, matches))
+            else:
+                results = [core.initialize(match) for match in matches]
+            for match, (result, err) in zip(matches, results):
+                if is_device_not_found(err):
+                    logger.debug("Skipping initialization of unavailable device: %s", match)
+                    continue
+                if err:
+                    logger.warning("Initialization failed for %s: %s", match, err)
+                elif result:
+                    logger.debug("Initialized %s: %s", match, result)
 
-    applier = HeadlessApplier(core)
-    applier.apply_profile_data(state)
+        applier = HeadlessApplier(core)
+        applier.apply_profile_data(state)
     logger.info("Profile state applied; exiting.")
     return 0
 
@@ -1,32 +1,60 @@
 """Backend registry and discovery system."""
 
+import importlib
 import logging
-from typing import List, Type, Tuple, Any
+from typing import List, Optional, Type, Tuple, Any
 from .base_backend import DeviceBackend, BackendCapabilities
 
 
 logger = logging.getLogger(__name__)
 
+# Backend modules imported on first lookup (importing triggers @register_backend)
+BACKEND_MODULES = ("liquidctl_backend", "hwmon_backend")
+
 
 class BackendRegistry:
     """Manages registration and discovery of device backends."""
     
     _backends: List[Type[DeviceBackend]] = []
+    # Available backends in priority order; None until the next probe
+    _sorted_cache: Optional[List[Type[DeviceBackend]]] = None
+    _modules_loaded = False
     
     @classmethod
     def register(cls, backend_class: Type[DeviceBackend]) -> None:
         """Register a backend class."""
         if backend_class not in cls._backends:
             cls._backends.append(backend_class)
+            cls._sorted_cache = None
             caps = backend_class.get_capabilities()
             logger.debug("Registered backend: %s (priority: %d)", caps.name, caps.priority)
     
     @classmethod
     def get_all_backends(cls) -> List[Type[DeviceBackend]]:
-        """Get all registered backends, sorted by priority (highest first)."""
-        available = [b for b in cls._backends if b.is_available()]
-        # Sort by priority (descending) - higher priority backends checked first
-        return sorted(available, key=lambda b: b.get_capabilities().priority, reverse=True)
+        """Get all registered backends, sorted by priority (highest first).
+
+        Availability is probed once and cached until invalidate() is called.
+        """
+        if cls._sorted_cache is None:
+            cls._load_backend_modules()
+            available = [b for b in cls._backends if b.is_available()]
+            # Sort by priority (descending) - higher priority backends checked first
+            cls._sorted_cache = sorted(available, key=lambda b: b.get_capabilities().priority, reverse=True)
+        return list(cls._sorted_cache)
+    
+    @classmethod
+    def _load_backend_modules(cls) -> None:
+        """Import BACKEND_MODULES once so their backends are registered before the first probe."""
+        if cls._modules_loaded:
+            return
+        for name in BACKEND_MODULES:
+            importlib.import_module(f".{name}", __package__)
+        cls._modules_loaded = True
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget cached availability so the next lookup probes backends again."""
+        cls._sorted_cache = None
     
     @classmethod
     def discover_all_devices(cls) -> List[Tuple[Type[DeviceBackend], List[Any]]]:
@@ -1,9 +1,17 @@
 """User configuration helpers for liquidctl-gui."""
 
 import json
+import os
+import tempfile
 from copy import deepcopy
 from pathlib import Path
 
+# Optional faster JSON codec; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 CONFIG_DIR = Path.home() / ".liquidctl-gui"
 CONFIG_FILE = CONFIG_DIR / "config.json"
@@ -12,49 +20,120 @@ CURRENT_PROFILE_FILE = CONFIG_DIR / "current_profile.json"
 
 
 def _merge_dicts(base, override):
-    for key, value in override.items():
-        if isinstance(value, dict) and isinstance(base.get(key), dict):
-            base[key] = _merge_dicts(base[key], value)
-        else:
-            base[key] = value
+    # Walk nested dicts with an explicit stack instead of recursing
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     return base
 
 
+def _loads(raw):
+    """Parse JSON from bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data, pretty=True):
+    """Encode data as UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    # Compact output takes json's C encoder fast path; indent forces the
+    # pure-Python encoder
+    if pretty:
+        text = json.dumps(data, indent=2)
+    else:
+        text = json.dumps(data, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _atomic_write(path, data):
+    """Write bytes to path via a synced temp file and rename, so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            # mkstemp creates 0600; keep the permissions of the file being replaced
+            os.chmod(tmp_name, path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load_json(path):
+    """Read and parse a JSON file; raises like a plain read (FileNotFoundError, ValueError, ...)."""
+    return _loads(Path(path).read_bytes())
+
+
 def load_config(defaults):
     config = deepcopy(defaults)
-    if not CONFIG_FILE.exists():
-        return config, False, None
     try:
-        data = json.loads(CONFIG_FILE.read_text())
+        data = _load_json(CONFIG_FILE)
+    except FileNotFoundError:
+        return config, False, None
     except Exception as exc:
         return config, False, exc
     return _merge_dicts(config, data), True, None
 
 
+# (path, encoded bytes, st_mtime_ns, st_size) of the last config written, so
+# identical saves skip the disk while the file is still the one we wrote
+_last_saved_config = None
+
+
 def save_config(config):
+    global _last_saved_config
+    data = _dumps(config)
+    if _last_saved_config is not None and _last_saved_config[:2] == (CONFIG_FILE, data):
+        try:
+            st = CONFIG_FILE.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            if (st.st_mtime_ns, st.st_size) == _last_saved_config[2:]:
+                return
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    _atomic_write(CONFIG_FILE, data)
+    st = CONFIG_FILE.stat()
+    _last_saved_config = (CONFIG_FILE, data, st.st_mtime_ns, st.st_size)
 
 
-def save_profile(profile, name):
-    """Save a profile to the profiles directory."""
+def save_profile(profile, name, pretty=True):
+    """Save a profile to the profiles directory (indented unless pretty is False)."""
     PROFILES_DIR.mkdir(parents=True, exist_ok=True)
     profile_path = PROFILES_DIR / f"{name}.json"
-    profile_path.write_text(json.dumps(profile, indent=2))
+    _atomic_write(profile_path, _dumps(profile, pretty))
     return profile_path
 
 
 def load_profile(name):
     """Load a profile by name from the profiles directory."""
-    profile_path = PROFILES_DIR / f"{name}.json"
-    if not profile_path.exists():
-        return None
     try:
-        return json.loads(profile_path.read_text())
+        return load_profile_file(PROFILES_DIR / f"{name}.json")
     except Exception:
         return None
 
 
+def load_profile_file(path):
+    """Load a profile from any JSON file path; raises on missing or invalid files."""
+    return _load_json(path)
+
+
 def list_profiles():
     """List all available profile names."""
     if not PROFILES_DIR.exists():
@@ -88,7 +167,8 @@ def save_current_state(profile, profile_name=None):
         "speeds": profile.get("speeds", {}),
         "active_profile": profile_name
     }
-    CURRENT_PROFILE_FILE.write_text(json.dumps(state, indent=2))
+    # Rewritten after every settings change and never hand-edited: keep it compact
+    _atomic_write(CURRENT_PROFILE_FILE, _dumps(state, pretty=False))
 
 
 def load_current_state():
@@ -97,10 +177,8 @@ def load_current_state():
     Returns:
         Tuple of (profile_dict, profile_name) or (None, None)
     """
-    if not CURRENT_PROFILE_FILE.exists():
-        return None, None
     try:
-        state = json.loads(CURRENT_PROFILE_FILE.read_text())
+        state = _load_json(CURRENT_PROFILE_FILE)
         profile = {
             "colors": state.get("colors", {}),
             "modes": state.get("modes", {}),
@@ -17,11 +17,29 @@ class ConfigHelpers:
         except (TypeError, ValueError):
             return default
 
+    def _cached_config_value(self, key, build):
+        """Return build(raw) for a config key, reusing the last result while the same raw object is configured.
+
+        Config values are replaced, never edited in place, so identity is enough.
+        """
+        raw = self.config.get(key, [])
+        cache = self.__dict__.setdefault("_config_cache", {})
+        cached = cache.get(key)
+        if cached is None or cached[0] is not raw:
+            cached = (raw, build(raw))
+            cache[key] = cached
+        return cached[1]
+
     def get_preset_colors(self):
-        """Get user-configured preset colors."""
-        presets = self.config.get("preset_colors", [])
-        return [(item.get("label", ""), item.get("value", "")) for item in presets]
+        """Get user-configured preset colors (shared list; do not modify)."""
+        return self._cached_config_value(
+            "preset_colors",
+            lambda presets: [(item.get("label", ""), item.get("value", "")) for item in presets],
+        )
 
     def get_speed_presets(self):
-        """Get user-configured speed preset values."""
-        return [int(value) for value in self.config.get("speed_presets", []) if str(value).isdigit()]
+        """Get user-configured speed preset values (shared list; do not modify)."""
+        return self._cached_config_value(
+            "speed_presets",
+            lambda values: [int(value) for value in values if str(value).isdigit()],
+        )
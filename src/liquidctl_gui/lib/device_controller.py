@@ -8,8 +8,12 @@ providing a clean separation of concerns between UI and device operations.
 import logging
 from typing import Optional, Tuple
 
+from .error_handler import is_device_not_found
 from .hwmon_api import HwmonDevice
 
+# Lighting modes that typically need a color
+MODES_NEEDING_COLOR = frozenset({"fixed", "breathing", "pulse", "fading", "flash", "double-flash"})
+
 
 class DeviceController:
     """
@@ -122,15 +126,16 @@ class DeviceController:
         if not success:
             friendly = self.app.core.friendly_error(stderr)
             # Silently skip unavailable devices
-            if friendly and "not found" in friendly.lower():
+            if is_device_not_found(friendly):
                 self.app.status_label.set_text(f"Device {device_match} not available")
                 return
             if friendly:
                 self.app.show_error(friendly)
             return
         
-        self.app.last_colors[f"{device_match}:{channel}"] = hex_color
-        self.app.last_modes[f"{device_match}:{channel}"] = "fixed"
+        key = f"{device_match}:{channel}"
+        self.app.last_colors[key] = hex_color
+        self.app.last_modes[key] = "fixed"
         self.app._auto_save_state()
         self.app.status_label.set_text(f"{channel} set to {hex_color}")
     
@@ -149,15 +154,16 @@ class DeviceController:
         if not success:
             friendly = self.app.core.friendly_error(stderr)
             # Silently skip unavailable devices
-            if friendly and "not found" in friendly.lower():
+            if is_device_not_found(friendly):
                 self.app.status_label.set_text(f"Device {device_match} not available")
                 return
             if friendly:
                 self.app.show_error(friendly)
             return
         
-        self.app.last_colors[f"{device_match}:{channel}"] = color_hex
-        self.app.last_modes[f"{device_match}:{channel}"] = "fixed"
+        key = f"{device_match}:{channel}"
+        self.app.last_colors[key] = color_hex
+        self.app.last_modes[key] = "fixed"
         self.app._auto_save_state()
         self.app.status_label.set_text(f"{channel} set to {color_hex}")
     
@@ -178,10 +184,7 @@ class DeviceController:
         color_key = f"{device_match}:{channel}"
         last_color = self.app.last_colors.get(color_key)
 
-        # Modes that typically need a color
-        modes_needing_color = {"fixed", "breathing", "pulse", "fading", "flash", "double-flash"}
-
-        if mode in modes_needing_color:
+        if mode in MODES_NEEDING_COLOR:
             if not last_color:
                 last_color = self.app.choose_color(f"Pick Color for {mode}")
             if not last_color:
@@ -193,7 +196,7 @@ class DeviceController:
         if not success:
             # Silently skip unavailable devices
             err_msg = self.app.core.friendly_error(err) or err
-            if "not found" in err_msg.lower():
+            if is_device_not_found(err_msg):
                 self.app.status_label.set_text(f"Device {device_match} not available")
                 return
             self.app.show_error(err_msg)
@@ -220,7 +223,7 @@ class DeviceController:
         if not success:
             friendly = self.app.core.friendly_error(stderr)
             # Silently skip unavailable devices
-            if friendly and "not found" in friendly.lower():
+            if is_device_not_found(friendly):
                 self.app.status_label.set_text(f"Device {device_match} not available")
                 return
             if friendly:
@@ -257,7 +260,7 @@ class DeviceController:
         if not success:
             friendly = self.app.core.friendly_error(stderr)
             # Silently skip unavailable devices
-            if friendly and "not found" in friendly.lower():
+            if is_device_not_found(friendly):
                 self.app.status_label.set_text(f"Device {device_match} not available")
                 return
             if friendly:
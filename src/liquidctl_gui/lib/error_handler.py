@@ -5,11 +5,24 @@ Provides structured error messages with context for easier debugging and AI inte
 """
 
 import logging
+import re
 import sys
 from typing import Optional, Dict, Any
 from enum import Enum
 
 
+# Phrases that mean the target device is missing or unplugged
+_NOT_FOUND_RE = re.compile(
+    r"not found|no device|device unavailable|cannot find device|no such device",
+    re.IGNORECASE,
+)
+
+
+def is_device_not_found(error) -> bool:
+    """Check if an error message (or exception) indicates the device is not available."""
+    return bool(error) and _NOT_FOUND_RE.search(str(error)) is not None
+
+
 class ErrorCategory(Enum):
     """Error categories for structured error handling."""
     DEVICE_NOT_FOUND = "DEVICE_NOT_FOUND"
@@ -152,18 +165,7 @@ class ErrorHandler:
         Returns:
             True if device not found error
         """
-        if not error_message:
-            return False
-        
-        error_lower = error_message.lower()
-        not_found_indicators = [
-            "not found",
-            "no device",
-            "device unavailable",
-            "cannot find device",
-            "no such device"
-        ]
-        return any(indicator in error_lower for indicator in not_found_indicators)
+        return is_device_not_found(error_message)
 
 
 def configure_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
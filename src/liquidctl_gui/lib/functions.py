@@ -1,16 +1,22 @@
 """Core helpers for liquidctl-gui."""
 
+import contextlib
 import logging
 import os
 import re
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List
 
 from .liquidctl_api import LiquidctlAPI, LIQUIDCTL_AVAILABLE, SIMULATION_MODE
 
+# "Device #0: NZXT Kraken X (X42, X52, X62 or X72)" lines from `liquidctl list`
+_DEVICE_LINE_RE = re.compile(r"Device #\d+:\s+(.+)")
+
 
 @dataclass
 class DeviceInfo:
@@ -27,12 +33,23 @@ class DeviceInfo:
 class LiquidctlCore:
     """Core interface for liquidctl - uses Python API when available, CLI as fallback."""
 
+    # Reuse a successful status read for this long (shorter than any poll interval)
+    STATUS_CACHE_SECS = 1.0
+
+    # (LIQUIDCTL_BIN, PATH) -> resolved liquidctl path, shared by every instance
+    _path_cache = {}
+
     def __init__(self, liquidctl_path=None, prefer_api=True):
+        self._explicit_path = liquidctl_path
         self.liquidctl_path = liquidctl_path or self._resolve_liquidctl_path()
         # Use API if liquidctl is available OR if simulation mode is enabled
         self.prefer_api = prefer_api and (LIQUIDCTL_AVAILABLE or SIMULATION_MODE)
         self._api = LiquidctlAPI() if self.prefer_api else None
         self._logger = logging.getLogger(__name__)
+        # device_match -> (monotonic time, (status_text, error_string))
+        self._status_cache = {}
+        # device_match -> lock so CLI invocations never overlap on one device
+        self._cli_locks = {}
 
     @property
     def is_available(self):
@@ -44,7 +61,28 @@ class LiquidctlCore:
         """Check if using Python API (vs CLI)."""
         return self.prefer_api and self._api is not None
 
+    @classmethod
+    def invalidate_path_cache(cls) -> None:
+        """Forget resolved liquidctl paths, e.g. after liquidctl was installed."""
+        cls._path_cache.clear()
+
+    def refresh_liquidctl_path(self) -> None:
+        """Re-resolve the liquidctl binary (unless one was passed in), e.g. after it was installed."""
+        self.invalidate_path_cache()
+        if not self._explicit_path:
+            self.liquidctl_path = self._resolve_liquidctl_path()
+
     def _resolve_liquidctl_path(self):
+        cache_key = (os.environ.get("LIQUIDCTL_BIN", ""), os.environ.get("PATH", ""))
+        try:
+            return self._path_cache[cache_key]
+        except KeyError:
+            pass
+        path = self._find_liquidctl_path()
+        self._path_cache[cache_key] = path
+        return path
+
+    def _find_liquidctl_path(self):
         env_path = os.environ.get("LIQUIDCTL_BIN")
         if env_path and Path(env_path).is_file():
             return env_path
@@ -119,22 +157,52 @@ class LiquidctlCore:
 
     def initialize(self, device_match: str) -> tuple:
         """Initialize device. Returns (result_text, error_string)."""
+        self.invalidate_status_cache(device_match)
         if self.using_api:
             result, err = self._api.initialize(device_match)
             return self._api.format_status(result), err
-        stdout, stderr = self.run_command(self.build_init_cmd(device_match))
-        return stdout, stderr
+        return self._run_device_command(device_match, self.build_init_cmd(device_match))
+
+    @contextlib.contextmanager
+    def device_sessions(self, device_matches):
+        """Keep each device connected while a batch of operations runs.
+
+        With the Python API every device is connected once for the whole block
+        instead of once per call. The CLI cannot share a connection between
+        invocations, so there it is a no-op.
+        """
+        with contextlib.ExitStack() as stack:
+            if self.using_api:
+                for device_match in device_matches:
+                    stack.enter_context(self._api.session(device_match))
+            yield
 
     def get_status(self, device_match: str) -> tuple:
         """Get device status. Returns (status_text, error_string)."""
+        cached = self._status_cache.get(device_match)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.STATUS_CACHE_SECS:
+            return cached[1]
         if self.using_api:
             result, err = self._api.get_status(device_match)
-            return self._api.format_status(result), err
-        stdout, stderr = self.run_command(self.build_status_cmd(device_match))
-        return stdout, stderr
+            status = (self._api.format_status(result), err)
+        else:
+            status = self._run_device_command(device_match, self.build_status_cmd(device_match))
+        # Only successful reads are reused; errors are retried next call
+        if not status[1]:
+            self._status_cache[device_match] = (now, status)
+        return status
+
+    def invalidate_status_cache(self, device_match: str = None) -> None:
+        """Force the next get_status() for device_match (or every device) to hit the device."""
+        if device_match is None:
+            self._status_cache.clear()
+        else:
+            self._status_cache.pop(device_match, None)
 
     def set_color(self, device_match: str, channel: str, mode: str, color_hex: str, speed: str = 'normal') -> tuple:
         """Set LED color/mode. Returns (success, error_string)."""
+        self.invalidate_status_cache(device_match)
         if self.using_api:
             # Convert hex color to RGB tuple
             colors = [self._hex_to_rgb(color_hex)] if color_hex else []
@@ -147,7 +215,7 @@ class LiquidctlCore:
             cmd = self.build_set_mode_cmd(device_match, channel, mode, color_hex)
         else:
             cmd = self.build_set_mode_cmd(device_match, channel, mode)
-        stdout, stderr = self.run_command(cmd)
+        stdout, stderr = self._run_device_command(device_match, cmd)
         return not stderr, stderr
 
     def set_speed(self, device_match: str, channel: str, speed) -> tuple:
@@ -158,11 +226,17 @@ class LiquidctlCore:
             self._logger.warning("Invalid speed value passed: %r", speed)
             return False, f"Invalid speed value: {speed}"
 
+        self.invalidate_status_cache(device_match)
         if self.using_api:
             return self._api.set_speed(device_match, channel, speed_int)
-        stdout, stderr = self.run_command(self.build_set_speed_cmd(device_match, channel, speed_int))
+        stdout, stderr = self._run_device_command(device_match, self.build_set_speed_cmd(device_match, channel, speed_int))
         return not stderr, stderr
 
+    def _run_device_command(self, device_match: str, cmd) -> tuple:
+        """Run a CLI command against one device, one invocation per device at a time."""
+        with self._cli_locks.setdefault(device_match, threading.Lock()):
+            return self.run_command(cmd)
+
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> tuple:
         """Convert '#rrggbb' to (r, g, b) tuple."""
@@ -196,12 +270,8 @@ class LiquidctlCore:
 
     @staticmethod
     def parse_list_output(output):
-        devices = []
-        for line in output.splitlines():
-            match = re.match(r"Device #\d+:\s+(.+)", line.strip())
-            if match:
-                devices.append(match.group(1).strip())
-        return devices
+        matches = (_DEVICE_LINE_RE.match(line.strip()) for line in output.splitlines())
+        return [match.group(1).strip() for match in matches if match]
 
     @staticmethod
     def friendly_error(stderr):
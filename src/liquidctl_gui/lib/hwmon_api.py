@@ -7,6 +7,8 @@ Provides detection and control of motherboard fan headers through sysfs.
 import os
 import glob
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
@@ -14,11 +16,21 @@ from typing import List, Dict, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 
+def _close_quietly(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
 class HwmonDevice:
     """Represents a motherboard fan controller accessible via hwmon."""
     
     # Safety: minimum PWM value (0-255 scale) to prevent fans stopping completely
     MIN_PWM_VALUE = 51  # ~20% duty cycle
+
+    # Status reads within this window reuse the last sysfs scan
+    STATUS_CACHE_SECS = 1.0
     
     def __init__(self, hwmon_path: str, name: str, chip_name: str = None):
         self.hwmon_path = Path(hwmon_path)
@@ -43,6 +55,13 @@ class HwmonDevice:
         
         # Match identifier for config persistence
         self.match = f"hwmon:{self.chip_name}"
+
+        # (monotonic timestamp, status list) from the last sysfs scan
+        self._status_cache = None
+        # Open read-only fds for sensor files, reused across status reads
+        self._fds: Dict[Path, int] = {}
+        self._fd_lock = threading.Lock()
+        self._closed = False
         
         logger.info(
             "Detected hwmon device: %s with %d PWM outputs, %d fans, %d temp sensors",
@@ -156,6 +175,7 @@ class HwmonDevice:
         Initialize device by enabling manual PWM control.
         Returns list of (message, value, unit) tuples.
         """
+        self.invalidate_status_cache()
         results = []
         for channel_num, channel_info in self.pwm_channels.items():
             enable_file = channel_info["enable"]
@@ -179,12 +199,57 @@ class HwmonDevice:
         Get current fan speeds and temperatures.
         Returns list of (metric, value, unit) tuples.
         """
+        cache = self._status_cache
+        now = time.monotonic()
+        if cache and now - cache[0] < self.STATUS_CACHE_SECS:
+            return list(cache[1])
+        status = self._read_status()
+        self._status_cache = (now, status)
+        return list(status)
+
+    def invalidate_status_cache(self) -> None:
+        """Force the next get_status() call to re-read sysfs."""
+        self._status_cache = None
+
+    def _read_int(self, path: Path) -> int:
+        """Read an integer sysfs attribute through a cached fd."""
+        # The lock covers the read too, so close() can never pull an fd out
+        # from under a poll running on a worker thread
+        with self._fd_lock:
+            if self._closed:
+                # Released device (e.g. a poll that outlived a rescan): read
+                # without caching so no fd is left open on the stale object
+                return int(path.read_bytes().strip())
+            fd = self._fds.get(path)
+            if fd is None:
+                fd = self._fds[path] = os.open(path, os.O_RDONLY)
+            try:
+                # sysfs regenerates the value on every read at offset 0
+                data = os.pread(fd, 64, 0)
+            except OSError:
+                # The node may have gone away (hotplug/driver reload); reopen once
+                del self._fds[path]
+                _close_quietly(fd)
+                fd = self._fds[path] = os.open(path, os.O_RDONLY)
+                data = os.pread(fd, 64, 0)
+        return int(data.strip())
+
+    def close(self) -> None:
+        """Close cached sensor file descriptors; later reads open files uncached."""
+        with self._fd_lock:
+            self._closed = True
+            fds = list(self._fds.values())
+            self._fds.clear()
+        for fd in fds:
+            _close_quietly(fd)
+
+    def _read_status(self) -> List[Tuple[str, str, str]]:
         status = []
         
         # Read fan speeds
         for channel_num, fan_info in self.fan_inputs.items():
             try:
-                rpm = int(fan_info["input"].read_text().strip())
+                rpm = self._read_int(fan_info["input"])
                 label = fan_info["label"] or f"Fan {channel_num}"
                 status.append((label, str(rpm), "rpm"))
             except (ValueError, OSError):
@@ -194,7 +259,7 @@ class HwmonDevice:
         for channel_num, temp_info in self.temp_inputs.items():
             try:
                 # Temperature is in millidegrees Celsius
-                temp_millideg = int(temp_info["input"].read_text().strip())
+                temp_millideg = self._read_int(temp_info["input"])
                 temp_c = temp_millideg / 1000.0
                 label = temp_info["label"] or f"Temp {channel_num}"
                 status.append((label, f"{temp_c:.1f}", "°C"))
@@ -204,7 +269,7 @@ class HwmonDevice:
         # Read current PWM values
         for channel_num, pwm_info in self.pwm_channels.items():
             try:
-                pwm_value = int(pwm_info["pwm"].read_text().strip())
+                pwm_value = self._read_int(pwm_info["pwm"])
                 pwm_percent = int((pwm_value / 255.0) * 100)
                 label = pwm_info["label"] or f"PWM {channel_num}"
                 status.append((f"{label} duty", str(pwm_percent), "%"))
@@ -254,6 +319,7 @@ class HwmonDevice:
                 logger.warning("Could not set manual mode for %s: %s", channel, e)
         
         pwm_file = self.pwm_channels[channel_num]["pwm"]
+        self.invalidate_status_cache()
         try:
             pwm_file.write_text(f"{pwm_value}\n")
         except OSError as e:
@@ -264,8 +330,8 @@ class HwmonDevice:
         logger.info("Set %s to %d%% (PWM=%d)", label, speed_percent, pwm_value)
     
     def disconnect(self, **kwargs):
-        """Cleanup on disconnect (placeholder for interface compatibility)."""
-        pass
+        """Cleanup on disconnect (releases cached sensor fds)."""
+        self.close()
     
     def __str__(self):
         return f"HwmonDevice({self.chip_name})"
@@ -1,7 +1,9 @@
 """Wrapper for liquidctl Python API - dynamic device, mode, and channel discovery."""
 
+import contextlib
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, List
 from pathlib import Path
@@ -19,6 +21,23 @@ except ImportError:
 # Simulation mode - set LIQUIDCTL_SIMULATE=1 to use mock devices
 SIMULATION_MODE = os.environ.get('LIQUIDCTL_SIMULATE', '').lower() in ('1', 'true', 'yes')
 
+# Modes that control all LEDs globally (individual channel settings are skipped)
+GLOBAL_SYNC_MODES = frozenset({
+    "spectrum-wave", "color-cycle", "rainbow-flow", "super-rainbow",
+    "rainbow-pulse", "covering-marquee", "marquee-3", "marquee-4",
+    "marquee-5", "marquee-6", "moving-alternating-3", "moving-alternating-4",
+    "moving-alternating-5", "alternating-3", "alternating-4", "alternating-5"
+})
+
+# Modes that don't require colors (they generate their own effects)
+MODES_WITHOUT_COLOR = frozenset({
+    "spectrum-wave", "color-cycle", "off", "marquee-3", "marquee-4",
+    "marquee-5", "marquee-6", "covering-marquee", "alternating-3",
+    "alternating-4", "alternating-5", "moving-alternating-3",
+    "moving-alternating-4", "moving-alternating-5", "rainbow-flow",
+    "super-rainbow", "rainbow-pulse"
+})
+
 
 @dataclass
 class DeviceCapabilities:
@@ -143,6 +162,9 @@ class LiquidctlAPI:
         """
         self._devices = []
         self._device_map = {}  # description -> device instance
+        self._device_locks = {}  # description -> lock serialising connect/disconnect
+        self._load_lock = threading.Lock()  # one lazy device enumeration at a time
+        self._sessions = set()  # descriptions held connected by session()
         self._simulated_devices = simulated_devices
         self._simulation_mode = simulated_devices is not None or SIMULATION_MODE
 
@@ -183,8 +205,10 @@ class LiquidctlAPI:
 
         sim_label = " (SIMULATED)" if self._simulation_mode else ""
         _LOGGER.info("[API] Scanning for devices%s...", sim_label)
-        self._devices = []
-        self._device_map = {}
+        # Build into locals and swap in at the end so status reads on the
+        # worker thread never see a half-populated map.
+        devices = []
+        device_map = {}
 
         try:
             for device in self._get_device_iterator():
@@ -206,8 +230,8 @@ class LiquidctlAPI:
                     supports_lighting=supports_lighting,
                     supports_cooling=supports_cooling,
                 )
-                self._devices.append(caps)
-                self._device_map[device.description] = device
+                devices.append(caps)
+                device_map[device.description] = device
                 _LOGGER.info("[API] Found device: %s", caps.name)
                 _LOGGER.info("[API]   Driver: %s", caps.driver_class)
                 _LOGGER.info("[API]   Color channels: %s", caps.color_channels)
@@ -217,16 +241,66 @@ class LiquidctlAPI:
         except Exception as e:
             _LOGGER.exception("Failed to enumerate devices: %s", e)
 
+        self._devices = devices
+        self._device_map = device_map
         return self._devices
 
     def get_device(self, description: str):
         """Get a device instance by its description."""
-        # Lazy-load devices if map is empty
+        # Lazy-load devices if map is empty; worker threads can get here
+        # together, so only the first one enumerates
         if not self._device_map:
-            _LOGGER.debug("[API] Device map empty, loading devices...")
-            self.find_devices()
+            with self._load_lock:
+                if not self._device_map:
+                    _LOGGER.debug("[API] Device map empty, loading devices...")
+                    self.find_devices()
         return self._device_map.get(description)
 
+    def _device_lock(self, description: str) -> threading.Lock:
+        """Return the lock guarding a device's connect/op/disconnect sequence."""
+        return self._device_locks.setdefault(description, threading.Lock())
+
+    @contextlib.contextmanager
+    def _connected(self, description: str, device):
+        """Hold the device lock with the device connected, reusing an open session."""
+        with self._device_lock(description):
+            if description in self._sessions:
+                yield
+                return
+            device.connect()
+            try:
+                yield
+            finally:
+                device.disconnect()
+
+    @contextlib.contextmanager
+    def session(self, description: str):
+        """Keep a device connected across several operations (e.g. a profile apply).
+
+        Operations inside the block skip their own connect/disconnect. Nested
+        sessions for the same device reuse the outer one. If the device is
+        unknown or fails to connect, operations fall back to connecting
+        individually and report their own errors.
+        """
+        device = self.get_device(description)
+        opened = False
+        if device is not None:
+            with self._device_lock(description):
+                if description not in self._sessions:
+                    try:
+                        device.connect()
+                        self._sessions.add(description)
+                        opened = True
+                    except Exception as e:
+                        _LOGGER.warning("[API] Could not open session for %s: %s", description, e)
+        try:
+            yield
+        finally:
+            if opened:
+                with self._device_lock(description):
+                    self._sessions.discard(description)
+                    device.disconnect()
+
     def get_capabilities(self, description: str) -> DeviceCapabilities | None:
         """Get capabilities for a device by description."""
         for caps in self._devices:
@@ -257,9 +331,8 @@ class LiquidctlAPI:
             return [], f"Device not found: {description}"
 
         try:
-            device.connect()
-            result = device.initialize() or []
-            device.disconnect()
+            with self._connected(description, device):
+                result = device.initialize() or []
             _LOGGER.info("[API] Initialize complete, returned %d properties", len(result))
             return result, ""
         except Exception as e:
@@ -274,9 +347,8 @@ class LiquidctlAPI:
             return [], f"Device not found: {description}"
 
         try:
-            device.connect()
-            result = device.get_status() or []
-            device.disconnect()
+            with self._connected(description, device):
+                result = device.get_status() or []
             _LOGGER.debug("[API] Status returned %d properties", len(result))
             return result, ""
         except Exception as e:
@@ -291,25 +363,15 @@ class LiquidctlAPI:
             return False, f"Device not found: {description}"
 
         try:
-            # Modes that don't require colors (they generate their own effects)
-            modes_without_color = {
-                "spectrum-wave", "color-cycle", "off", "marquee-3", "marquee-4", 
-                "marquee-5", "marquee-6", "covering-marquee", "alternating-3", 
-                "alternating-4", "alternating-5", "moving-alternating-3", 
-                "moving-alternating-4", "moving-alternating-5", "rainbow-flow", 
-                "super-rainbow", "rainbow-pulse"
-            }
-            
             # If mode requires a color (e.g. 'fixed') but no colors were supplied,
             # return a clear error instead of calling into the driver which will
             # raise an exception.
-            if (not colors) and (mode not in modes_without_color):
+            if (not colors) and (mode not in MODES_WITHOUT_COLOR):
                 _LOGGER.warning("[API] set_color: no colors provided for mode=%s device=%s channel=%s", mode, description, channel)
                 return False, "No colors provided for mode"
 
-            device.connect()
-            device.set_color(channel=channel, mode=mode, colors=colors, speed=speed)
-            device.disconnect()
+            with self._connected(description, device):
+                device.set_color(channel=channel, mode=mode, colors=colors, speed=speed)
             _LOGGER.info("[API] set_color succeeded")
             return True, ""
         except Exception as e:
@@ -334,9 +396,8 @@ class LiquidctlAPI:
             return False, f"Device not found: {description}"
 
         try:
-            device.connect()
-            device.set_fixed_speed(channel=channel, duty=speed_int)
-            device.disconnect()
+            with self._connected(description, device):
+                device.set_fixed_speed(channel=channel, duty=speed_int)
             _LOGGER.info("[API] set_speed succeeded")
             return True, ""
         except PermissionError as e:
@@ -6,8 +6,6 @@ handling profile save/load dialogs, profile data application, and state tracking
 """
 
 import logging
-from pathlib import Path
-import json
 
 try:
     import gi
@@ -21,8 +19,11 @@ from .config import (
     load_profile as load_profile_from_disk,
     list_profiles,
     delete_profile,
+    load_profile_file,
     save_current_state
 )
+from .error_handler import is_device_not_found
+from .liquidctl_api import GLOBAL_SYNC_MODES, MODES_WITHOUT_COLOR
 
 
 class ProfileManager:
@@ -43,22 +44,8 @@ class ProfileManager:
         self.app = app_window
         self._logger = logging.getLogger(__name__)
         
-        # Modes that control all LEDs globally (skip individual channel settings)
-        self.global_sync_modes = {
-            "spectrum-wave", "color-cycle", "rainbow-flow", "super-rainbow",
-            "rainbow-pulse", "covering-marquee", "marquee-3", "marquee-4",
-            "marquee-5", "marquee-6", "moving-alternating-3", "moving-alternating-4",
-            "moving-alternating-5", "alternating-3", "alternating-4", "alternating-5"
-        }
-        
-        # Modes that don't require colors
-        self.modes_without_color = {
-            "spectrum-wave", "color-cycle", "off", "marquee-3", "marquee-4",
-            "marquee-5", "marquee-6", "covering-marquee", "alternating-3",
-            "alternating-4", "alternating-5", "moving-alternating-3",
-            "moving-alternating-4", "moving-alternating-5", "rainbow-flow",
-            "super-rainbow", "rainbow-pulse"
-        }
+        self.global_sync_modes = GLOBAL_SYNC_MODES
+        self.modes_without_color = MODES_WITHOUT_COLOR
     
     # ========================================================================
     # Profile Saving
@@ -75,25 +62,23 @@ class ProfileManager:
         # Find devices with global sync modes
         devices_with_global_sync = set()
         for key, mode in self.app.last_modes.items():
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
             if channel == "sync" and mode in self.global_sync_modes:
                 devices_with_global_sync.add(device)
         
         # Build profile, filtering out individual LEDs for devices with global sync
-        colors = {}
-        modes = {}
-        
-        for key, value in self.app.last_colors.items():
-            device, channel = key.split(":", 1)
-            # Keep sync channels, or individual LEDs if device doesn't have global sync
-            if channel == "sync" or device not in devices_with_global_sync:
-                colors[key] = value
-        
-        for key, value in self.app.last_modes.items():
-            device, channel = key.split(":", 1)
-            # Keep sync channels, or individual LEDs if device doesn't have global sync
-            if channel == "sync" or device not in devices_with_global_sync:
-                modes[key] = value
+        if devices_with_global_sync:
+            def keep(key):
+                # Keep sync channels, or individual LEDs if device doesn't have global sync
+                device, _, channel = key.partition(":")
+                return channel == "sync" or device not in devices_with_global_sync
+
+            colors = {key: value for key, value in self.app.last_colors.items() if keep(key)}
+            modes = {key: value for key, value in self.app.last_modes.items() if keep(key)}
+        else:
+            # Nothing to filter: copy the state dicts without splitting keys
+            colors = dict(self.app.last_colors)
+            modes = dict(self.app.last_modes)
         
         profile = {
             "colors": colors,
@@ -133,7 +118,7 @@ class ProfileManager:
             
         try:
             # Save to profiles directory
-            save_profile_to_disk(profile, profile_name)
+            save_profile_to_disk(profile, profile_name, pretty=bool(self.app.config.get("profile_pretty", True)))
             # Also save as current state with profile name
             save_current_state(profile, profile_name)
             # Set as active profile and clear modified flag
@@ -280,7 +265,7 @@ class ProfileManager:
             Tuple of (success, error_message)
         """
         try:
-            data = json.loads(Path(path).read_text())
+            data = load_profile_file(path)
         except Exception as e:
             self._logger.warning("Failed to load profile %s: %s", path, e)
             return False, str(e)
@@ -307,130 +292,157 @@ class ProfileManager:
         Args:
             data: Profile dictionary with keys: colors, modes, speeds
         """
+        # Connect each device once for the whole apply, not once per channel
+        matches = {
+            key.partition(":")[0]
+            for section in ("colors", "modes", "speeds")
+            for key in data.get(section, {})
+        }
+        with self.app.core.device_sessions(sorted(matches)):
+            self._apply_profile_data(data)
+
+    def _apply_profile_data(self, data):
+        log = self._logger
         # Replace (don't merge) to avoid accumulating old state
         self.app.last_colors = data.get("colors", {}).copy()
         self.app.last_modes = data.get("modes", {}).copy()
         self.app.last_speeds = data.get("speeds", {}).copy()
         
         # Separate sync channels from regular channels and track which devices have global sync
+        global_sync_modes = self.global_sync_modes
+        no_color = self.modes_without_color
         devices_with_global_sync = set()
-        sync_modes = {}
-        regular_modes = {}
+        # Devices that reported "not found"; their remaining channels are skipped
+        unavailable = set()
+        sync_modes = []
+        regular_modes = []
         
+        # Split each key once; the apply passes below reuse the parts
         for key, mode in self.app.last_modes.items():
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
             if channel == "sync":
-                sync_modes[key] = mode
+                sync_modes.append((key, device, channel, mode))
                 # If sync mode is a global effect, mark device to skip individual LEDs
-                if mode in self.global_sync_modes:
+                if mode in global_sync_modes:
                     devices_with_global_sync.add(device)
-                    self._logger.info("Device %s has global sync mode: %s (will skip individual LEDs)", device, mode)
+                    log.info("Device %s has global sync mode: %s (will skip individual LEDs)", device, mode)
             else:
-                regular_modes[key] = mode
+                regular_modes.append((key, device, channel, mode))
         
         # STEP 1: Apply sync channels FIRST (they set the base state for all LEDs)
-        for key, mode in sync_modes.items():
-            device, channel = key.split(":", 1)
+        for key, device, channel, mode in sync_modes:
+            if device in unavailable:
+                continue
             color_hex = self.app.last_colors.get(key, "")
             
             try:
-                if mode in self.modes_without_color or not color_hex:
+                if mode in no_color or not color_hex:
                     success, err = self.app.set_led_mode(device, channel, mode)
-                    if err and "not found" in err.lower():
-                        self._logger.debug("Skipping unavailable device: %s", device)
+                    if is_device_not_found(err):
+                        unavailable.add(device)
+                        log.debug("Skipping unavailable device: %s", device)
                         continue
-                    self._logger.info("Applied SYNC mode %s to %s", mode, key)
+                    log.info("Applied SYNC mode %s to %s", mode, key)
                 else:
                     success, err = self.app.set_led_mode_with_color(device, channel, mode, color_hex)
-                    if err and "not found" in err.lower():
-                        self._logger.debug("Skipping unavailable device: %s", device)
+                    if is_device_not_found(err):
+                        unavailable.add(device)
+                        log.debug("Skipping unavailable device: %s", device)
                         continue
-                    self._logger.info("Applied SYNC mode %s with color %s to %s", mode, color_hex, key)
+                    log.info("Applied SYNC mode %s with color %s to %s", mode, color_hex, key)
             except Exception as e:
-                if "not found" in str(e).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(e):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                 else:
-                    self._logger.warning("Failed to apply sync mode %s for %s: %s", mode, key, e)
+                    log.warning("Failed to apply sync mode %s for %s: %s", mode, key, e)
         
         # STEP 2: Apply individual channel modes (but skip if device has global sync mode)
-        for key, mode in regular_modes.items():
-            device, channel = key.split(":", 1)
+        for key, device, channel, mode in regular_modes:
             
             # Skip individual LEDs if device has a global sync effect active
             if device in devices_with_global_sync:
-                self._logger.debug("Skipping individual LED %s (device has global sync effect)", key)
+                log.debug("Skipping individual LED %s (device has global sync effect)", key)
                 continue
             
+            if device in unavailable:
+                continue
             color_hex = self.app.last_colors.get(key, "")
             
             try:
-                if mode in self.modes_without_color or not color_hex:
+                if mode in no_color or not color_hex:
                     success, err = self.app.set_led_mode(device, channel, mode)
-                    if err and "not found" in err.lower():
-                        self._logger.debug("Skipping unavailable device: %s", device)
+                    if is_device_not_found(err):
+                        unavailable.add(device)
+                        log.debug("Skipping unavailable device: %s", device)
                         continue
-                    self._logger.debug("Applied mode %s (no color) to %s", mode, key)
+                    log.debug("Applied mode %s (no color) to %s", mode, key)
                 else:
                     success, err = self.app.set_led_mode_with_color(device, channel, mode, color_hex)
-                    if err and "not found" in err.lower():
-                        self._logger.debug("Skipping unavailable device: %s", device)
+                    if is_device_not_found(err):
+                        unavailable.add(device)
+                        log.debug("Skipping unavailable device: %s", device)
                         continue
-                    self._logger.debug("Applied mode %s with color %s to %s", mode, color_hex, key)
+                    log.debug("Applied mode %s with color %s to %s", mode, color_hex, key)
             except Exception as e:
-                if "not found" in str(e).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(e):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                 else:
-                    self._logger.warning("Failed to apply mode %s for %s: %s", mode, key, e)
+                    log.warning("Failed to apply mode %s for %s: %s", mode, key, e)
 
         # STEP 3: Apply colors for channels that have colors but no explicit mode (default to fixed)
         for key, color_hex in self.app.last_colors.items():
             if not color_hex or key in self.app.last_modes:
                 continue  # Skip if no color or already processed with mode
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
             
             # Skip if device has global sync mode
             if device in devices_with_global_sync:
-                self._logger.debug("Skipping color-only LED %s (device has global sync effect)", key)
+                log.debug("Skipping color-only LED %s (device has global sync effect)", key)
                 continue
             
+            if device in unavailable:
+                continue
             try:
                 success, err = self.app.set_led_color(device, channel, color_hex)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(err):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                     continue
-                self._logger.debug("Applied color %s (fixed mode) to %s", color_hex, key)
+                log.debug("Applied color %s (fixed mode) to %s", color_hex, key)
             except Exception as e:
-                if "not found" in str(e).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(e):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                 else:
-                    self._logger.warning("Failed to apply color %s for %s: %s", color_hex, key, e)
+                    log.warning("Failed to apply color %s for %s: %s", color_hex, key, e)
 
         # STEP 4: Apply speeds
         for key, speed in self.app.last_speeds.items():
-            device, channel = key.split(":", 1)
+            device, _, channel = key.partition(":")
+            if device in unavailable:
+                continue
             try:
                 success, err = self.app.set_speed(device, channel, speed)
-                if err and "not found" in err.lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(err):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                     continue
-                self._logger.debug("Applied speed %s to %s", speed, key)
+                log.debug("Applied speed %s to %s", speed, key)
             except Exception as e:
-                if "not found" in str(e).lower():
-                    self._logger.debug("Skipping unavailable device: %s", device)
+                if is_device_not_found(e):
+                    unavailable.add(device)
+                    log.debug("Skipping unavailable device: %s", device)
                 else:
-                    self._logger.warning("Failed to apply speed %s for %s: %s", speed, key, e)
+                    log.warning("Failed to apply speed %s for %s: %s", speed, key, e)
     
     # ========================================================================
     # State Management
     # ========================================================================
     
-    def auto_save_state(self):
-        """
-        Automatically save current state for session restore.
-        
-        Called after every settings change to persist state across sessions.
-        Marks profile as modified when changes are detected.
-        """
+    def write_current_state(self):
+        """Persist the current colors/modes/speeds for session restore; return True on success."""
         try:
             profile = {
                 "colors": self.app.last_colors,
@@ -438,10 +450,10 @@ class ProfileManager:
                 "speeds": self.app.last_speeds
             }
             save_current_state(profile, self.app.active_profile_name)
-            # Mark profile as modified when settings change
-            self.mark_profile_modified()
+            return True
         except Exception as e:
             self._logger.warning("Failed to auto-save state: %s", e)
+            return False
     
     def mark_profile_modified(self):
         """Mark the current profile as modified (needs saving)."""
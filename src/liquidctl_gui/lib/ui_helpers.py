@@ -29,8 +29,9 @@ class UiHelpers:
         return label
 
     def add_button(self, container, text, callback):
+        """Add a button; callback is connected as-is and receives the clicked button."""
         button = Gtk.Button(label=text)
-        button.connect("clicked", lambda *_: callback())
+        button.connect("clicked", callback)
         container.pack_start(button, False, False, 0)
         return button
 
@@ -47,6 +48,17 @@ class UiHelpers:
         container.pack_start(combo, False, False, 0)
         return combo
 
+    def clear_container(self, container):
+        """Destroy all children, batching their child-property notifications."""
+        container.freeze_child_notify()
+        try:
+            # destroy() also unparents, and drops the widgets' signal
+            # handlers and references instead of leaving them floating
+            for child in container.get_children():
+                child.destroy()
+        finally:
+            container.thaw_child_notify()
+
     def add_frame(self, container, title):
         frame = Gtk.Frame(label=title)
         frame_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
@@ -64,6 +76,8 @@ class UiHelpers:
         adjustment = Gtk.Adjustment(value=value, lower=min_val, upper=max_val, step_increment=1, page_increment=5)
         scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=adjustment)
         scale.set_digits(0)
+        # Snap dragged values to whole percents so the applied value matches the label
+        scale.set_round_digits(0)
         scale.set_hexpand(True)
         container.pack_start(scale, False, False, 0)
         return scale
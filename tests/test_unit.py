@@ -1,7 +1,11 @@
 import json
+import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -10,6 +14,7 @@ sys.path.insert(0, str(SRC_DIR))
 
 from liquidctl_gui.lib import config as config_module
 from liquidctl_gui.lib.config_helpers import ConfigHelpers
+from liquidctl_gui.lib.error_handler import is_device_not_found
 from liquidctl_gui.lib.functions import LiquidctlCore
 
 
@@ -64,6 +69,77 @@ Device #2: Some Other Device
         self.assertIn("Permission denied", LiquidctlCore.friendly_error("Permission denied"))
         self.assertEqual(LiquidctlCore.friendly_error("some other error"), "some other error")
 
+    def test_liquidctl_path_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            binary = Path(tmpdir) / "liquidctl"
+            binary.write_text("")
+            LiquidctlCore.invalidate_path_cache()
+            try:
+                with mock.patch.dict(os.environ, {"LIQUIDCTL_BIN": str(binary)}):
+                    self.assertEqual(LiquidctlCore(prefer_api=False).liquidctl_path, str(binary))
+                    binary.unlink()
+                    # Resolved once per environment; refreshing re-runs the lookup
+                    self.assertEqual(LiquidctlCore(prefer_api=False).liquidctl_path, str(binary))
+                    core = LiquidctlCore(prefer_api=False)
+                    core.refresh_liquidctl_path()
+                    self.assertNotEqual(core.liquidctl_path, str(binary))
+            finally:
+                LiquidctlCore.invalidate_path_cache()
+
+    def test_status_cache(self):
+        """get_status() should reuse a recent successful read until invalidated."""
+        core = LiquidctlCore(liquidctl_path="liquidctl", prefer_api=False)
+        calls = []
+
+        def fake_run(cmd):
+            calls.append(cmd)
+            return f"read {len(calls)}", ""
+
+        core.run_command = fake_run
+        self.assertEqual(core.get_status("kraken"), ("read 1", ""))
+        self.assertEqual(core.get_status("kraken"), ("read 1", ""))
+        self.assertEqual(len(calls), 1)
+
+        core.invalidate_status_cache("kraken")
+        self.assertEqual(core.get_status("kraken"), ("read 2", ""))
+
+    def test_cli_commands_serialised_per_device(self):
+        """CLI invocations for one device should never overlap."""
+        core = LiquidctlCore(liquidctl_path="liquidctl", prefer_api=False)
+        active = {}
+        overlaps = []
+
+        def fake_run(cmd):
+            device = cmd[3]
+            active[device] = active.get(device, 0) + 1
+            if active[device] > 1:
+                overlaps.append(cmd)
+            time.sleep(0.01)
+            active[device] -= 1
+            return "", ""
+
+        core.run_command = fake_run
+        threads = [
+            threading.Thread(target=core.initialize, args=("kraken",)),
+            threading.Thread(target=core.get_status, args=("kraken",)),
+            threading.Thread(target=core.set_speed, args=("kraken", "pump", 60)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(overlaps, [])
+
+
+class TestErrorHandler(unittest.TestCase):
+    def test_is_device_not_found(self):
+        self.assertTrue(is_device_not_found("Device not found: kraken"))
+        self.assertTrue(is_device_not_found("ERROR: No Such Device"))
+        self.assertFalse(is_device_not_found("Permission denied"))
+        self.assertFalse(is_device_not_found(""))
+        self.assertFalse(is_device_not_found(None))
+        self.assertTrue(is_device_not_found(OSError("No such device")))
+
 
 class TestConfigHelpers(unittest.TestCase):
     def test_config_accessors(self):
@@ -79,6 +155,15 @@ class TestConfigHelpers(unittest.TestCase):
         self.assertEqual(helper.get_speed_presets(), [40, 60, 100])
         self.assertEqual(helper.get_config_int("auto_refresh_seconds", 10), 5)
 
+    def test_preset_cache_follows_config(self):
+        """Preset lists are reused until the config value is replaced."""
+        helper = DummyConfig({"speed_presets": [40, 60]})
+        first = helper.get_speed_presets()
+        self.assertIs(helper.get_speed_presets(), first)
+
+        helper.config["speed_presets"] = [50]
+        self.assertEqual(helper.get_speed_presets(), [50])
+
 
 class TestConfigIO(unittest.TestCase):
     def test_load_save_config(self):
@@ -105,6 +190,78 @@ class TestConfigIO(unittest.TestCase):
         self.assertEqual(loaded["d"], 4)
         self.assertEqual(loaded["nested"], {"b": 2, "c": 99})
 
+    def test_save_config_skips_identical_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            original_dir = config_module.CONFIG_DIR
+            original_file = config_module.CONFIG_FILE
+            try:
+                config_module.CONFIG_DIR = tmp_path
+                config_module.CONFIG_FILE = tmp_path / "config.json"
+
+                config_module.save_config({"a": 1})
+                first_inode = config_module.CONFIG_FILE.stat().st_ino
+                config_module.save_config({"a": 1})
+                skipped = config_module.CONFIG_FILE.stat().st_ino == first_inode
+                # An outside edit is overwritten even when memory hasn't changed
+                config_module.CONFIG_FILE.write_text("sentinel")
+                config_module.save_config({"a": 1})
+                restored = json.loads(config_module.CONFIG_FILE.read_text())
+                config_module.save_config({"a": 2})
+                changed = json.loads(config_module.CONFIG_FILE.read_text())
+            finally:
+                config_module.CONFIG_DIR = original_dir
+                config_module.CONFIG_FILE = original_file
+
+        self.assertTrue(skipped)
+        self.assertEqual(restored, {"a": 1})
+        self.assertEqual(changed, {"a": 2})
+
+    def test_save_profile_compact(self):
+        profile = {"colors": {"kraken:ring": "#00ced1"}, "modes": {}, "speeds": {"kraken:pump": "60"}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_dir = config_module.PROFILES_DIR
+            try:
+                config_module.PROFILES_DIR = Path(tmpdir)
+                pretty_text = config_module.save_profile(profile, "pretty").read_text()
+                compact_text = config_module.save_profile(profile, "compact", pretty=False).read_text()
+            finally:
+                config_module.PROFILES_DIR = original_dir
+
+        self.assertIn("\n", pretty_text)
+        self.assertNotIn(" ", compact_text)
+        self.assertEqual(json.loads(compact_text), profile)
+
+    def test_save_profile_replaces_atomically(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_dir = config_module.PROFILES_DIR
+            try:
+                config_module.PROFILES_DIR = Path(tmpdir)
+                path = config_module.save_profile({"speeds": {"kraken:pump": "60"}}, "quiet")
+                path.chmod(0o640)
+                config_module.save_profile({"speeds": {"kraken:pump": "100"}}, "quiet")
+                leftovers = sorted(p.name for p in Path(tmpdir).iterdir())
+                mode = path.stat().st_mode & 0o777
+                saved = json.loads(path.read_text())
+            finally:
+                config_module.PROFILES_DIR = original_dir
+
+        self.assertEqual(leftovers, ["quiet.json"])
+        self.assertEqual(mode, 0o640)
+        self.assertEqual(saved, {"speeds": {"kraken:pump": "100"}})
+
+    def test_load_profile_file_follows_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "profile.json"
+            path.write_text(json.dumps({"speeds": {"kraken:pump": "60"}}))
+
+            first = config_module.load_profile_file(path)
+            first["speeds"].clear()  # callers get their own copy
+            self.assertEqual(config_module.load_profile_file(path), {"speeds": {"kraken:pump": "60"}})
+
+            path.write_text(json.dumps({"speeds": {"kraken:pump": "100"}}))
+            self.assertEqual(config_module.load_profile_file(path), {"speeds": {"kraken:pump": "100"}})
+
 
 class TestLiquidctlAPI(unittest.TestCase):
     """Tests for LiquidctlAPI using simulated devices."""
@@ -220,6 +377,22 @@ class TestLiquidctlAPI(unittest.TestCase):
         # Verify state was updated
         self.assertEqual(self.kraken._current_speeds['pump'], 75)
 
+    def test_api_session_keeps_device_connected(self):
+        """Operations inside session() should reuse one connection."""
+        from liquidctl_gui.lib.liquidctl_api import LiquidctlAPI
+
+        api = LiquidctlAPI(simulated_devices=[self.kraken])
+        api.find_devices()
+        description = "NZXT Kraken X (X53, X63 or X73)"
+
+        with api.session(description):
+            self.assertTrue(self.kraken._connected)
+            success, _ = api.set_speed(description, channel='pump', speed=60)
+            self.assertTrue(success)
+            # The op must not disconnect a device held by the session
+            self.assertTrue(self.kraken._connected)
+        self.assertFalse(self.kraken._connected)
+
     def test_api_format_status(self):
         """API should format status output correctly."""
         from liquidctl_gui.lib.liquidctl_api import LiquidctlAPI
@@ -334,5 +507,40 @@ class TestMockDevices(unittest.TestCase):
         self.assertIn('MockCommanderPro', names)
 
 
+class TestHwmonDevice(unittest.TestCase):
+    """Tests for HwmonDevice against a fake sysfs directory."""
+
+    def test_status_cache(self):
+        """get_status() should reuse recent reads until invalidated."""
+        from liquidctl_gui.lib.hwmon_api import HwmonDevice
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fan = Path(tmp) / "fan1_input"
+            fan.write_text("1200\n")
+            device = HwmonDevice(tmp, "test", "testchip")
+
+            self.assertEqual(device.get_status(), [("Fan 1", "1200", "rpm")])
+            fan.write_text("1500\n")
+            self.assertEqual(device.get_status(), [("Fan 1", "1200", "rpm")])
+
+            device.invalidate_status_cache()
+            self.assertEqual(device.get_status(), [("Fan 1", "1500", "rpm")])
+
+    def test_closed_device_reads_without_caching_fds(self):
+        """A poll that outlives close() still reads, but leaves no fd behind."""
+        from liquidctl_gui.lib.hwmon_api import HwmonDevice
+
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "fan1_input").write_text("1200\n")
+            device = HwmonDevice(tmp, "test", "testchip")
+            device.get_status()
+            self.assertTrue(device._fds)
+
+            device.close()
+            device.invalidate_status_cache()
+            self.assertEqual(device.get_status(), [("Fan 1", "1200", "rpm")])
+            self.assertEqual(device._fds, {})
+
+
 if __name__ == "__main__":
     unittest.main()